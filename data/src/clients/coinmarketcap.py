@@ -39,7 +39,7 @@ class CoinMarketCapAPIError(PriceClientError):
         self.payload = payload
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Interval:
     """The resolution used for a historical quote and the half-open window it covers."""
 
@@ -1,6 +1,8 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
+from types import MappingProxyType
 from typing import Any
 
 import requests
@@ -14,6 +16,8 @@ from utils.misc import utc_now
 
 from .errors import PriceClientError
 
+_ONE_DAY = timedelta(days=1)
+
 
 class OpenExchangeRatesAPIError(PriceClientError):
     def __init__(self, message: str, *, status_code: int | None = None, payload: Any | None = None) -> None:
@@ -22,12 +26,12 @@ class OpenExchangeRatesAPIError(PriceClientError):
         self.payload = payload
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HistoricalRates:
     date: date
     timestamp: datetime
     base: str
-    rates: dict[str, Decimal]
+    rates: Mapping[str, Decimal]
 
 
 class OpenExchangeRatesClient:
@@ -47,6 +51,9 @@ class OpenExchangeRatesClient:
         self.timeout = timeout
         self._session = session or requests.Session()
         self.source_name = source_name
+        # A day's snapshot carries every currency, so pairs priced on the same date share one request. Only past days
+        # are cached: today's snapshot keeps changing until the day closes.
+        self._snapshots: dict[date, HistoricalRates] = {}
 
         retries = Retry(
             total=retry_attempts,
@@ -74,11 +81,15 @@ class OpenExchangeRatesClient:
             rate=rate,
             source=self.source_name,
             valid_from=valid_from,
-            valid_to=valid_from + timedelta(days=1),
+            valid_to=valid_from + _ONE_DAY,
             fetched_at=utc_now(),
         )
 
     def get_historical_rates(self, *, target_date: date) -> HistoricalRates:
+        cached = self._snapshots.get(target_date)
+        if cached is not None:
+            return cached
+
         path = f"/historical/{target_date.isoformat()}.json"
         payload = self._request("GET", path)
 
@@ -93,12 +104,15 @@ class OpenExchangeRatesClient:
             code_raw.upper(): self._to_decimal(rate) for code_raw, rate in rates_raw.items()
         }
 
-        return HistoricalRates(
+        snapshot = HistoricalRates(
             date=target_date,
             timestamp=timestamp,
             base=str(base_currency).upper(),
-            rates=parsed_rates,
+            rates=MappingProxyType(parsed_rates),
         )
+        if target_date < utc_now().date():
+            self._snapshots[target_date] = snapshot
+        return snapshot
 
     def _request(self, method: str, path: str) -> dict[str, Any]:
         url = f"{self.base_url}{path}"
@@ -1,9 +1,9 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Iterable
+from typing import Any, Iterable
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, UniqueConstraint, Uuid, select, tuple_
+from sqlalchemy import Boolean, DateTime, ForeignKey, String, UniqueConstraint, Uuid, insert, select, tuple_
 from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from db.base import Base, DecimalAsString
@@ -78,35 +78,54 @@ class CorrectedLedgerLegOrm(Base):
     event: Mapped[CorrectedLedgerEventOrm] = relationship(back_populates="legs")
 
 
+# create_many goes through bulk INSERTs instead of the unit of work: imports write every event at once, and per-row
+# ORM objects with relationship bookkeeping cost several times more than the INSERTs themselves.
+def _event_rows(events: list[LedgerEvent]) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": event.id,
+            "timestamp": event.timestamp,
+            "ingestion": event.ingestion,
+            "note": event.note,
+            "origin_location": event.event_origin.location.value,
+            "origin_external_id": event.event_origin.external_id,
+        }
+        for event in events
+    ]
+
+
+def _leg_rows(events: list[LedgerEvent]) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": leg.id,
+            "event_id": event.id,
+            "asset_id": leg.asset_id,
+            "quantity": leg.quantity,
+            "account_chain_id": leg.account_chain_id,
+            "is_fee": leg.is_fee,
+        }
+        for event in events
+        for leg in event.legs
+    ]
+
+
 class LedgerEventRepository:
     def __init__(self, session: Session) -> None:
         self._session = session
 
     def create_many(self, events: list[LedgerEvent]) -> list[LedgerEvent]:
-        orm_events: list[LedgerEventOrm] = []
-        for event in events:
-            orm_event = LedgerEventOrm(
-                id=event.id,
-                timestamp=event.timestamp,
-                ingestion=event.ingestion,
-                note=event.note,
-                origin_location=event.event_origin.location.value,
-                origin_external_id=event.event_origin.external_id,
-            )
-            orm_event.legs = [
-                LedgerLegOrm(
-                    id=leg.id,
-                    asset_id=leg.asset_id,
-                    quantity=leg.quantity,
-                    account_chain_id=leg.account_chain_id,
-                    is_fee=leg.is_fee,
-                )
-                for leg in event.legs
-            ]
-            orm_events.append(orm_event)
-
-        self._session.add_all(orm_events)
-        self._session.commit()
+        try:
+            if events:
+                self._session.execute(insert(LedgerEventOrm), _event_rows(events))
+                leg_rows = _leg_rows(events)
+                if leg_rows:
+                    self._session.execute(insert(LedgerLegOrm), leg_rows)
+            self._session.commit()
+        except Exception:
+            # Core INSERTs leave no pending ORM state to discard; without this, a partial batch would be committed
+            # by the next commit on the shared session.
+            self._session.rollback()
+            raise
         return events
 
     def get(self, event_id: LedgerEventId) -> LedgerEvent | None:
@@ -188,30 +207,16 @@ class CorrectedLedgerEventRepository:
         self._session = session
 
     def create_many(self, events: list[LedgerEvent]) -> list[LedgerEvent]:
-        orm_events: list[CorrectedLedgerEventOrm] = []
-        for event in events:
-            orm_event = CorrectedLedgerEventOrm(
-                id=event.id,
-                timestamp=event.timestamp,
-                ingestion=event.ingestion,
-                note=event.note,
-                origin_location=event.event_origin.location.value,
-                origin_external_id=event.event_origin.external_id,
-            )
-            orm_event.legs = [
-                CorrectedLedgerLegOrm(
-                    id=leg.id,
-                    asset_id=leg.asset_id,
-                    quantity=leg.quantity,
-                    account_chain_id=leg.account_chain_id,
-                    is_fee=leg.is_fee,
-                )
-                for leg in event.legs
-            ]
-            orm_events.append(orm_event)
-
-        self._session.add_all(orm_events)
-        self._session.commit()
+        try:
+            if events:
+                self._session.execute(insert(CorrectedLedgerEventOrm), _event_rows(events))
+                leg_rows = _leg_rows(events)
+                if leg_rows:
+                    self._session.execute(insert(CorrectedLedgerLegOrm), leg_rows)
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
         return events
 
     def list(self, asset_id: AssetId | None = None) -> list[LedgerEvent]:
@@ -1,8 +1,8 @@
 from collections import defaultdict
-from decimal import Decimal
 from operator import gt, lt
 
 from ..ledger import AssetId, LedgerEvent, LedgerLeg
+from .constants import ZERO
 from .pipeline_types import (
     _ProjectedAssetResidualGroup,
     _ProjectedEvent,
@@ -40,14 +40,14 @@ def project_event_quantities(event: LedgerEvent) -> _ProjectedEvent:
 
 
 def _project_asset_group(legs: list[LedgerLeg]) -> _ProjectedAssetResidualGroup | None:
-    net_quantity = sum((leg.quantity for leg in legs), start=Decimal(0))
+    net_quantity = sum((leg.quantity for leg in legs), start=ZERO)
     if net_quantity == 0:
         return None
 
     op = gt if net_quantity > 0 else lt
     relevant_legs = sorted((leg for leg in legs if op(leg.quantity, 0)), key=lambda leg: leg.leg_key)
 
-    total_raw_quantity = sum((leg.quantity for leg in relevant_legs), start=Decimal(0))
+    total_raw_quantity = sum((leg.quantity for leg in relevant_legs), start=ZERO)
     remaining_quantity = net_quantity
     projected_legs: list[_ProjectedResidualLeg] = []
 
@@ -6,7 +6,7 @@ from config import BASE_CURRENCY_ASSET_ID
 
 from ..ledger import AssetId, EventOrigin
 from ..pricing import PriceProvider
-from .constants import ValuationTier, is_reference_priced, valuation_tier
+from .constants import ZERO, ValuationTier, is_reference_priced, valuation_tier
 from .errors import AcquisitionDisposalUnresolvedRatesError, AcquisitionDisposalValuationError
 from .pipeline_types import _ProjectedAssetResidualGroup, _ProjectedEvent
 
@@ -129,7 +129,7 @@ def _reject_liability_rebalancing(
     """A negative (liability) rate cannot participate in tier rebalancing or remainder solving, whose
     logic assumes positive per-side EUR magnitudes. Clean borrow/repay events cancel to zero on one
     side and never reach here; anything that does needs a manual correction."""
-    negative = [group.asset_id for group in groups if rates.get(group.asset_id, Decimal(0)) < 0]
+    negative = [group.asset_id for group in groups if rates.get(group.asset_id, ZERO) < 0]
     if negative:
         raise AcquisitionDisposalValuationError(
             "Liability-rated asset(s) present where the event must be balanced; resolve with a correction: "
@@ -255,7 +255,7 @@ def _side_total(
             for group in groups
             if _group_side(group) == side and group.asset_id in rates
         ),
-        start=Decimal(0),
+        start=ZERO,
     )
 
 
@@ -278,7 +278,7 @@ def _groups_total(
     *,
     rates: dict[AssetId, Decimal],
 ) -> Decimal:
-    return sum((_direct_total(group, rate=rates[group.asset_id]) for group in groups), start=Decimal(0))
+    return sum((_direct_total(group, rate=rates[group.asset_id]) for group in groups), start=ZERO)
 
 
 def _apply_target_total(
@@ -313,7 +313,7 @@ def _group_side(group: _ProjectedAssetResidualGroup) -> int:
 
 
 def _group_net_quantity(group: _ProjectedAssetResidualGroup) -> Decimal:
-    return sum((residual.quantity for residual in group.residuals), start=Decimal(0))
+    return sum((residual.quantity for residual in group.residuals), start=ZERO)
 
 
 def _format_asset_ids(groups: Sequence[_ProjectedAssetResidualGroup]) -> str:
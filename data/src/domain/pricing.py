@@ -6,7 +6,7 @@ from typing import Protocol
 from .ledger import AssetId
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PriceRecord:
     base_id: AssetId
     quote_id: AssetId
@@ -1,10 +1,13 @@
+import io
 import logging
+import re
 from collections import defaultdict
 from csv import DictReader
 from datetime import datetime, timedelta
 from decimal import Decimal
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, TextIO
 
 from pydantic import field_validator
 
@@ -15,6 +18,8 @@ from utils.misc import ensure_utc_datetime
 
 logger = logging.getLogger(__name__)
 KRAKEN_INGESTION_SOURCE = "kraken_ledger_csv"
+_ENTRY_TIME = attrgetter("time")
+_TIMESTAMP_SHAPE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}")
 
 ASSET_ALIASES = {
     "DOT28.S": "DOT",
@@ -57,7 +62,11 @@ class KrakenLedgerEntry(StrictBaseModel):
     @classmethod
     def _parse_timestamp(cls, value: str | datetime) -> datetime:
         if isinstance(value, str):
-            value = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+            # Kraken writes "YYYY-MM-DD HH:MM:SS"; fromisoformat parses that in C, strptime was most of the import time.
+            # fromisoformat also accepts dates, offsets and fractions, so pin the exact shape first.
+            if _TIMESTAMP_SHAPE.fullmatch(value) is None:
+                raise ValueError(f"Expected Kraken timestamp as YYYY-MM-DD HH:MM:SS, got {value!r}")
+            value = datetime.fromisoformat(value)
         return ensure_utc_datetime(value)
 
     @field_validator("subtype", mode="before")
@@ -102,9 +111,28 @@ def _ledger_leg(
     )
 
 
+def _parse_entries(handle: TextIO) -> list[KrakenLedgerEntry]:
+    return [KrakenLedgerEntry.model_validate(row) for row in DictReader(handle)]
+
+
 class KrakenImporter:
-    def __init__(self, source_path: str) -> None:
-        self._source_path = Path(source_path)
+    def __init__(
+        self,
+        source_path: str | None = None,
+        *,
+        entries: Iterable[KrakenLedgerEntry] | None = None,
+        handle: TextIO | None = None,
+    ) -> None:
+        """Read the ledger CSV at `source_path` or from an open `handle`, or import already parsed `entries`."""
+        if sum(source is not None for source in (source_path, entries, handle)) != 1:
+            raise ValueError("KrakenImporter needs exactly one of source_path, entries or handle")
+        self._source: Path | TextIO | str | list[KrakenLedgerEntry]
+        if source_path is not None:
+            self._source = Path(source_path)
+        elif entries is not None:
+            self._source = list(entries)
+        elif handle is not None:
+            self._source = handle
 
     def _build_origin(self, refid: str) -> EventOrigin:
         return EventOrigin(location=EventLocation.KRAKEN, external_id=refid)
@@ -121,12 +149,16 @@ class KrakenImporter:
         return events
 
     def _read_entries(self) -> list[KrakenLedgerEntry]:
-        entries: list[KrakenLedgerEntry] = []
-        with self._source_path.open(encoding="utf-8") as handle:
-            reader = DictReader(handle)
-            for row in reader:
-                entries.append(KrakenLedgerEntry.model_validate(row))
-        return entries
+        if isinstance(self._source, list):
+            return self._source
+        if isinstance(self._source, Path):
+            with self._source.open(encoding="utf-8") as handle:
+                return _parse_entries(handle)
+        if not isinstance(self._source, str):
+            # A handle can only be read once; keep its text so every load, including a retry after a bad row, parses
+            # the whole CSV.
+            self._source = self._source.read()
+        return _parse_entries(io.StringIO(self._source))
 
     def _preprocess_entries(self, entries: list[KrakenLedgerEntry]) -> list[KrakenLedgerEntry]:
         pending: dict[str, dict[tuple[str, str, Decimal], list[KrakenLedgerEntry]]] = {
@@ -137,7 +169,7 @@ class KrakenImporter:
         staking_rows = 0
         matched_pairs = 0
 
-        for entry in sorted(entries, key=lambda item: item.time):
+        for entry in sorted(entries, key=_ENTRY_TIME):
             subtype = (entry.subtype or "").lower()
             flow_and_role = _STAKING_TRANSFER_FLOW_AND_ROLE.get(subtype)
             if flow_and_role is None:
@@ -238,7 +270,7 @@ class KrakenImporter:
         if not entries:
             raise ValueError("Empty Kraken ledger group cannot produce an event")
 
-        lines = sorted(entries, key=lambda entry: entry.time)
+        lines = sorted(entries, key=_ENTRY_TIME)
 
         if len(lines) == 1 and lines[0].type == "deposit":
             return self._deposit_event(lines[0])
@@ -5,7 +5,7 @@ from collections.abc import Callable
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import TypedDict
-from uuid import uuid4
+from uuid import UUID
 
 from fastapi.testclient import TestClient
 
@@ -15,6 +15,8 @@ from domain.ledger import EventLocation, EventOrigin, LedgerEvent, LedgerLeg
 from tests.api.conftest import raw_event
 from tests.constants import BTC, ETH, LEDGER_WALLET
 
+TIMESTAMP = datetime(2024, 2, 3, 10, 0, tzinfo=timezone.utc)
+
 
 class CorrectionSourcePayload(TypedDict):
     location: str
@@ -95,7 +97,7 @@ def test_post_creates_and_get_lists_discard(
             raw_event(
                 location=EventLocation.ARBITRUM,
                 external_id=payload["sources"][0]["external_id"],
-                timestamp=datetime(2024, 2, 3, 10, 0, tzinfo=timezone.utc),
+                timestamp=TIMESTAMP,
             )
         ],
     )
@@ -153,7 +155,7 @@ def test_post_creates_replacement(
             raw_event(
                 location=EventLocation(source["location"]),
                 external_id=source["external_id"],
-                timestamp=datetime(2024, 2, 3, 10, 0, tzinfo=timezone.utc),
+                timestamp=TIMESTAMP,
             )
         ],
     )
@@ -185,7 +187,7 @@ def test_post_returns_409_when_source_is_already_consumed_by_active_correction(
             raw_event(
                 location=EventLocation.ARBITRUM,
                 external_id="0xdup",
-                timestamp=datetime(2024, 2, 3, 10, 0, tzinfo=timezone.utc),
+                timestamp=TIMESTAMP,
             )
         ],
     )
@@ -210,7 +212,7 @@ def test_delete_is_by_id_and_allows_manual_recreate(
             raw_event(
                 location=EventLocation.ARBITRUM,
                 external_id="0xrestore",
-                timestamp=datetime(2024, 2, 3, 10, 0, tzinfo=timezone.utc),
+                timestamp=TIMESTAMP,
             )
         ],
     )
@@ -246,7 +248,7 @@ def test_get_lists_persisted_corrections_in_desc_order(
 
 
 def test_delete_is_idempotent_for_missing_correction(client: TestClient) -> None:
-    response = client.delete(f"/corrections/{uuid4()}")
+    response = client.delete(f"/corrections/{UUID(int=0)}")
 
     assert response.status_code == 204
     assert client.get("/corrections").json() == []
@@ -275,13 +277,11 @@ def test_get_filtered_by_asset_matches_assets_of_claimed_raw_sources(
     persist_raw_events: Callable[[list[LedgerEvent]], None],
     persist_correction: Callable[[LedgerCorrectionDraft], LedgerCorrection],
 ) -> None:
-    timestamp = datetime(2024, 2, 3, 10, 0, tzinfo=timezone.utc)
-
     def eth_source(external_id: str) -> LedgerEvent:
         return raw_event(
             location=EventLocation.ARBITRUM,
             external_id=external_id,
-            timestamp=timestamp,
+            timestamp=TIMESTAMP,
             legs=[LedgerLeg(asset_id=ETH, quantity=Decimal("-1"), account_chain_id=LEDGER_WALLET)],
         )
 
@@ -291,12 +291,12 @@ def test_get_filtered_by_asset_matches_assets_of_claimed_raw_sources(
 
     # A legless discard reaches the ETH filter only through the raw event it claims.
     eth_discard = persist_correction(
-        LedgerCorrectionDraft(timestamp=timestamp, sources=frozenset([discarded_source.event_origin]))
+        LedgerCorrectionDraft(timestamp=TIMESTAMP, sources=frozenset([discarded_source.event_origin]))
     )
     # A replacement of an ETH source that books BTC instead matches on both assets.
     btc_replacement = persist_correction(
         LedgerCorrectionDraft(
-            timestamp=timestamp,
+            timestamp=TIMESTAMP,
             sources=frozenset([replaced_source.event_origin]),
             legs=frozenset([LedgerLeg(asset_id=BTC, quantity=Decimal("1"), account_chain_id=LEDGER_WALLET)]),
         )
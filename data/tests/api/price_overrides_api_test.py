@@ -1,5 +1,5 @@
 from typing import TypedDict
-from uuid import uuid4
+from uuid import UUID
 
 from fastapi.testclient import TestClient
 
@@ -88,7 +88,7 @@ def test_delete_removes_override(client: TestClient) -> None:
 
 
 def test_delete_is_idempotent_for_missing_override(client: TestClient) -> None:
-    response = client.delete(f"/price-overrides/{uuid4()}")
+    response = client.delete(f"/price-overrides/{UUID(int=0)}")
 
     assert response.status_code == 204
     assert client.get("/price-overrides").json() == []
@@ -18,6 +18,7 @@ _HIST_PATH = "/v3/cryptocurrency/quotes/historical"
 _MAP_PATH = "/v1/cryptocurrency/map"
 _RECENT = datetime(2026, 7, 4, 12, 3, 20, tzinfo=timezone.utc)
 _OLD = datetime(2020, 1, 1, 9, 30, tzinfo=timezone.utc)
+_OLD_DAY_START = datetime(2020, 1, 1, tzinfo=timezone.utc)
 
 
 def _mock_response(payload: Any, status_code: int = 200) -> Mock:
@@ -97,7 +98,7 @@ def test_old_timestamp_uses_daily_interval(tmp_path: Path) -> None:
     record = _client(session, tmp_path).fetch_record(BTC, EUR, timestamp=_OLD)
 
     assert record.rate == Decimal("7200")
-    assert record.valid_from == datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert record.valid_from == _OLD_DAY_START
     assert record.valid_to == record.valid_from + timedelta(days=1)
     assert session.get.call_args.kwargs["params"]["interval"] == "daily"
 
@@ -123,7 +124,7 @@ def test_returns_none_on_empty_quotes(tmp_path: Path) -> None:
 
     record = _client(session, tmp_path).fetch_record(BTC, USD, timestamp=_OLD)
     assert record.rate is None
-    assert record.valid_from == datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert record.valid_from == _OLD_DAY_START
 
 
 def test_returns_none_on_empty_data(tmp_path: Path) -> None:
@@ -186,7 +187,7 @@ def test_invalid_symbol_error_returns_unpriceable_record(tmp_path: Path) -> None
     assert record.quote_id == USD
     assert record.rate is None
     assert record.source == "coinmarketcap"
-    assert record.valid_from == datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert record.valid_from == _OLD_DAY_START
     assert record.valid_to == record.valid_from + timedelta(days=1)
     assert session.get.call_count == 1
     assert _MAP_PATH in session.get.call_args.args[0]
@@ -203,7 +204,7 @@ def test_configured_unpriceable_symbol_returns_none_without_request(tmp_path: Pa
     assert record.base_id == symbol
     assert record.rate is None
     assert record.source == "coinmarketcap"
-    assert record.valid_from == datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert record.valid_from == _OLD_DAY_START
     assert record.valid_to == record.valid_from + timedelta(days=1)
     # Neither symbol discovery nor a historical quote is requested.
     assert session.get.call_count == 0
@@ -1,13 +1,19 @@
 from datetime import date, datetime, time, timezone
 from decimal import Decimal
+from types import MappingProxyType
 from typing import Any, cast
 
 import pytest
 import requests
 
+from clients import open_exchange_rates
 from clients.open_exchange_rates import HistoricalRates, OpenExchangeRatesClient
 from tests.constants import EUR, USD
 
+_SNAPSHOT_TIMESTAMP = datetime(2024, 1, 1, 23, 59, tzinfo=timezone.utc)
+_DAY_START = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+_NEXT_DAY_START = datetime(2024, 1, 2, 0, 0, tzinfo=timezone.utc)
+
 
 class _StubResponse:
     def __init__(self, payload: dict[str, Any]) -> None:
@@ -59,6 +65,32 @@ def test_open_exchange_rates_http_client_parses_historical_payload() -> None:
     }
 
 
+def test_open_exchange_rates_http_client_reuses_snapshot_for_same_date() -> None:
+    stub_session = _StubSession(payload={"timestamp": 1704153599, "base": "USD", "rates": {"USD": 1}})
+    client = OpenExchangeRatesClient(app_id="test-app", session=cast(requests.Session, stub_session), retry_attempts=0)
+
+    first = client.get_historical_rates(target_date=date(2024, 1, 1))
+    stub_session.last_request = None
+    second = client.get_historical_rates(target_date=date(2024, 1, 1))
+
+    assert second is first
+    assert isinstance(first.rates, MappingProxyType)
+    assert stub_session.last_request is None
+
+
+def test_open_exchange_rates_http_client_refetches_current_date(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(open_exchange_rates, "utc_now", lambda: _SNAPSHOT_TIMESTAMP)
+    stub_session = _StubSession(payload={"timestamp": 1704153599, "base": "USD", "rates": {"USD": 1}})
+    client = OpenExchangeRatesClient(app_id="test-app", session=cast(requests.Session, stub_session), retry_attempts=0)
+
+    first = client.get_historical_rates(target_date=_SNAPSHOT_TIMESTAMP.date())
+    stub_session.last_request = None
+    second = client.get_historical_rates(target_date=_SNAPSHOT_TIMESTAMP.date())
+
+    assert second is not first
+    assert stub_session.last_request is not None
+
+
 class _StubOXRClient(OpenExchangeRatesClient):
     def __init__(self, snapshot: HistoricalRates, *, source_name: str = "open-exchange-rates-historical") -> None:
         self.snapshot = snapshot
@@ -73,7 +105,7 @@ class _StubOXRClient(OpenExchangeRatesClient):
 def test_price_source_converts_cross_currency_pair() -> None:
     historical = HistoricalRates(
         date=date(2024, 1, 1),
-        timestamp=datetime(2024, 1, 1, 23, 59, tzinfo=timezone.utc),
+        timestamp=_SNAPSHOT_TIMESTAMP,
         base="USD",
         rates={
             "USD": Decimal("1"),
@@ -90,15 +122,15 @@ def test_price_source_converts_cross_currency_pair() -> None:
     assert quote.rate == Decimal("1") / Decimal("0.9")
     assert quote.base_id == EUR
     assert quote.quote_id == USD
-    assert quote.valid_from == datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
-    assert quote.valid_to == datetime(2024, 1, 2, 0, 0, tzinfo=timezone.utc)
+    assert quote.valid_from == _DAY_START
+    assert quote.valid_to == _NEXT_DAY_START
     assert source.requested_dates == [date(2024, 1, 1)]
 
 
 def test_price_source_returns_empty_record_for_missing_currency() -> None:
     historical = HistoricalRates(
         date=date(2024, 1, 1),
-        timestamp=datetime(2024, 1, 1, 23, 59, tzinfo=timezone.utc),
+        timestamp=_SNAPSHOT_TIMESTAMP,
         base="USD",
         rates={"USD": Decimal("1")},
     )
@@ -107,8 +139,8 @@ def test_price_source_returns_empty_record_for_missing_currency() -> None:
     ts = datetime(2024, 1, 1, 9, 0, tzinfo=timezone.utc)
     record = source.fetch_record(EUR, USD, timestamp=ts)
     assert record.rate is None
-    assert record.valid_from == datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
-    assert record.valid_to == datetime(2024, 1, 2, 0, 0, tzinfo=timezone.utc)
+    assert record.valid_from == _DAY_START
+    assert record.valid_to == _NEXT_DAY_START
 
 
 @pytest.mark.skip(reason="This test requires real api key in .env")
@@ -1,8 +1,9 @@
 from collections.abc import Generator
+from typing import Any
 
 import pytest
-from sqlalchemy import Engine, create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import Connection, Engine, create_engine, event
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
 from db.base import Base
@@ -11,31 +12,54 @@ from tests.helpers.random_price_service import TestPriceService
 from tests.helpers.time_utils import DEFAULT_TIME_GEN
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def db_engine() -> Generator[Engine, None, None]:
     engine = create_engine(
         "sqlite://",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+
+    # pysqlite defers BEGIN until the first DML statement, which breaks SAVEPOINT; let SQLAlchemy emit it instead.
+    @event.listens_for(engine, "connect")
+    def _disable_driver_transactions(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN")
+
     yield engine
     engine.dispose()
 
 
-@pytest.fixture(scope="function")
-def test_session(db_engine: Engine) -> Generator[Session, None, None]:
+@pytest.fixture(scope="session")
+def _main_schema(db_engine: Engine) -> Generator[None, None, None]:
     Base.metadata.create_all(db_engine)
-    with sessionmaker(db_engine)() as session:
-        yield session
+    yield
     Base.metadata.drop_all(db_engine)
 
 
+@pytest.fixture(scope="function")
+def test_session(db_engine: Engine, _main_schema: None) -> Generator[Session, None, None]:
+    """Session bound to an outer transaction that is rolled back after the test.
+
+    Repository commits only release a SAVEPOINT, so the schema is created once per session and each test still
+    starts from empty tables.
+    """
+    with db_engine.connect() as connection:
+        transaction = connection.begin()
+        with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
+            yield session
+        transaction.rollback()
+
+
 @pytest.fixture(autouse=True)
 def _reset_default_time_gen() -> None:
     DEFAULT_TIME_GEN.reset()
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def price_service() -> TestPriceService:
     return TestPriceService(seed=3)
 
@@ -21,6 +21,9 @@ from domain.correction import LedgerCorrectionDraft
 from domain.ledger import EventLocation, EventOrigin, LedgerLeg
 from tests.constants import BTC, ETH, LEDGER_WALLET
 
+EARLIER = datetime(2024, 2, 3, 10, 30, tzinfo=timezone.utc)
+LATER = datetime(2024, 2, 4, 10, 30, tzinfo=timezone.utc)
+
 
 def _replacement(timestamp: datetime, external_id: str) -> LedgerCorrectionDraft:
     return LedgerCorrectionDraft(
@@ -54,8 +57,8 @@ def repo(corrections_session: Session) -> LedgerCorrectionRepository:
 
 
 def test_create_and_list_orders_by_timestamp_desc(repo: LedgerCorrectionRepository) -> None:
-    earlier = repo.create(_opening_balance(datetime(2024, 2, 3, 10, 30, tzinfo=timezone.utc)))
-    later = repo.create(_replacement(datetime(2024, 2, 4, 10, 30, tzinfo=timezone.utc), "0xlate"))
+    earlier = repo.create(_opening_balance(EARLIER))
+    later = repo.create(_replacement(LATER, "0xlate"))
 
     listed = repo.list()
 
@@ -66,7 +69,7 @@ def test_delete_source_backed_hard_deletes_and_keeps_auto_suppression(
     corrections_session: Session,
     repo: LedgerCorrectionRepository,
 ) -> None:
-    correction = repo.create(_replacement(datetime(2024, 2, 3, 10, 30, tzinfo=timezone.utc), "0xabc"))
+    correction = repo.create(_replacement(EARLIER, "0xabc"))
     repo.delete(correction.id)
 
     assert repo.list() == []
@@ -86,7 +89,7 @@ def test_delete_source_less_hard_deletes_without_auto_suppression(
     corrections_session: Session,
     repo: LedgerCorrectionRepository,
 ) -> None:
-    correction = repo.create(_opening_balance(datetime(2024, 2, 3, 10, 30, tzinfo=timezone.utc)))
+    correction = repo.create(_opening_balance(EARLIER))
     repo.delete(correction.id)
 
     assert repo.list() == []
@@ -100,8 +103,8 @@ def test_manual_create_reuses_source_after_delete_despite_auto_suppression(
     corrections_session: Session,
     repo: LedgerCorrectionRepository,
 ) -> None:
-    first = repo.create(_replacement(datetime(2024, 2, 3, 10, 30, tzinfo=timezone.utc), "0xshared"))
-    second = _replacement(datetime(2024, 2, 4, 10, 30, tzinfo=timezone.utc), "0xshared")
+    first = repo.create(_replacement(EARLIER, "0xshared"))
+    second = _replacement(LATER, "0xshared")
 
     repo.delete(first.id)
     recreated = repo.create(second)
@@ -112,8 +115,8 @@ def test_manual_create_reuses_source_after_delete_despite_auto_suppression(
 
 
 def test_create_rejects_duplicate_active_source(repo: LedgerCorrectionRepository) -> None:
-    first = _replacement(datetime(2024, 2, 3, 10, 30, tzinfo=timezone.utc), "0xshared")
-    second = _replacement(datetime(2024, 2, 4, 10, 30, tzinfo=timezone.utc), "0xshared")
+    first = _replacement(EARLIER, "0xshared")
+    second = _replacement(LATER, "0xshared")
 
     repo.create(first)
 
@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from decimal import Decimal
-from uuid import uuid4
+from typing import Protocol
+from uuid import UUID, uuid4
 
 import pytest
 from sqlalchemy.exc import IntegrityError
@@ -25,18 +26,29 @@ from domain.tax_event import TaxEvent, TaxEventKind
 from tests.constants import BTC, EUR
 
 
-def _sample_event(external_id: str, timestamp: datetime, *, note: str | None = None) -> LedgerEvent:
-    return LedgerEvent(
-        id=LedgerEventId(uuid4()),
-        timestamp=timestamp,
-        event_origin=EventOrigin(location=EventLocation.KRAKEN, external_id=external_id),
-        ingestion="test_ingestion",
-        note=note,
-        legs=[
-            LedgerLeg(asset_id=BTC, quantity=Decimal("0.1"), account_chain_id=KRAKEN_ACCOUNT_ID, is_fee=False),
-            LedgerLeg(asset_id=EUR, quantity=Decimal("-2000"), account_chain_id=KRAKEN_ACCOUNT_ID, is_fee=False),
-        ],
-    )
+class SampleEventFactory(Protocol):
+    def __call__(self, external_id: str, timestamp: datetime, *, note: str | None = None) -> LedgerEvent: ...
+
+
+@pytest.fixture(scope="module")
+def sample_event() -> SampleEventFactory:
+    btc_quantity = Decimal("0.1")
+    eur_quantity = Decimal("-2000")
+
+    def make(external_id: str, timestamp: datetime, *, note: str | None = None) -> LedgerEvent:
+        return LedgerEvent(
+            id=LedgerEventId(uuid4()),
+            timestamp=timestamp,
+            event_origin=EventOrigin(location=EventLocation.KRAKEN, external_id=external_id),
+            ingestion="test_ingestion",
+            note=note,
+            legs=[
+                LedgerLeg(asset_id=BTC, quantity=btc_quantity, account_chain_id=KRAKEN_ACCOUNT_ID, is_fee=False),
+                LedgerLeg(asset_id=EUR, quantity=eur_quantity, account_chain_id=KRAKEN_ACCOUNT_ID, is_fee=False),
+            ],
+        )
+
+    return make
 
 
 def _acquisition_lot_from_event(event: LedgerEvent, *, leg_index: int, cost_per_unit: Decimal) -> AcquisitionLot:
@@ -94,9 +106,9 @@ def corrected_repo(test_session: Session) -> CorrectedLedgerEventRepository:
     return CorrectedLedgerEventRepository(test_session)
 
 
-def test_create_and_get_ledger_event(repo: LedgerEventRepository) -> None:
+def test_create_and_get_ledger_event(repo: LedgerEventRepository, sample_event: SampleEventFactory) -> None:
     note = "approve"
-    event = _sample_event("ext-1", datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc), note=note)
+    event = sample_event("ext-1", datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc), note=note)
 
     repo.create_many([event])
 
@@ -110,9 +122,9 @@ def test_create_and_get_ledger_event(repo: LedgerEventRepository) -> None:
     assert {leg.asset_id for leg in fetched.legs} == {leg.asset_id for leg in event.legs}
 
 
-def test_list_ledger_events(repo: LedgerEventRepository) -> None:
-    first = _sample_event("first-ext", datetime(2024, 1, 2, 15, 30, 0, tzinfo=timezone.utc))
-    second = _sample_event("second-ext", datetime(2024, 1, 3, 8, 0, 0, tzinfo=timezone.utc))
+def test_list_ledger_events(repo: LedgerEventRepository, sample_event: SampleEventFactory) -> None:
+    first = sample_event("first-ext", datetime(2024, 1, 2, 15, 30, 0, tzinfo=timezone.utc))
+    second = sample_event("second-ext", datetime(2024, 1, 3, 8, 0, 0, tzinfo=timezone.utc))
 
     repo.create_many([first, second])
 
@@ -122,10 +134,10 @@ def test_list_ledger_events(repo: LedgerEventRepository) -> None:
     assert fetched_ids == {first.id, second.id}
 
 
-def test_list_event_timestamps_for_origins(repo: LedgerEventRepository) -> None:
-    first = _sample_event("first-ext", datetime(2024, 1, 2, 15, 30, 0, tzinfo=timezone.utc))
-    ignored = _sample_event("ignored-ext", datetime(2024, 1, 2, 16, 30, 0, tzinfo=timezone.utc))
-    second = _sample_event("second-ext", datetime(2024, 1, 3, 8, 0, 0, tzinfo=timezone.utc))
+def test_list_event_timestamps_for_origins(repo: LedgerEventRepository, sample_event: SampleEventFactory) -> None:
+    first = sample_event("first-ext", datetime(2024, 1, 2, 15, 30, 0, tzinfo=timezone.utc))
+    ignored = sample_event("ignored-ext", datetime(2024, 1, 2, 16, 30, 0, tzinfo=timezone.utc))
+    second = sample_event("second-ext", datetime(2024, 1, 3, 8, 0, 0, tzinfo=timezone.utc))
 
     repo.create_many([second, ignored, first])
 
@@ -137,17 +149,38 @@ def test_list_event_timestamps_for_origins(repo: LedgerEventRepository) -> None:
     ]
 
 
-def test_create_many_rejects_duplicate_event_origins(repo: LedgerEventRepository) -> None:
-    first = _sample_event("duplicate-ext", datetime(2024, 1, 2, 15, 30, 0, tzinfo=timezone.utc))
-    second = _sample_event("duplicate-ext", datetime(2024, 1, 3, 8, 0, 0, tzinfo=timezone.utc))
+def test_create_many_rejects_duplicate_event_origins(
+    repo: LedgerEventRepository,
+    sample_event: SampleEventFactory,
+) -> None:
+    first = sample_event("duplicate-ext", datetime(2024, 1, 2, 15, 30, 0, tzinfo=timezone.utc))
+    second = sample_event("duplicate-ext", datetime(2024, 1, 3, 8, 0, 0, tzinfo=timezone.utc))
+
+    with pytest.raises(IntegrityError):
+        repo.create_many([first, second])
+
+
+def test_create_many_keeps_nothing_after_failed_insert(
+    repo: LedgerEventRepository,
+    test_session: Session,
+    sample_event: SampleEventFactory,
+) -> None:
+    first = sample_event("duplicate-ext", datetime(2024, 1, 2, 15, 30, 0, tzinfo=timezone.utc))
+    second = sample_event("duplicate-ext", datetime(2024, 1, 3, 8, 0, 0, tzinfo=timezone.utc))
 
     with pytest.raises(IntegrityError):
         repo.create_many([first, second])
+    test_session.commit()
+
+    assert repo.list() == []
 
 
-def test_replace_acquisition_disposal_projection(projection_repo: AcquisitionDisposalProjectionRepository) -> None:
-    acquisition_event = _sample_event("acq-ext", datetime(2024, 1, 4, 9, 0, 0, tzinfo=timezone.utc))
-    disposal_event = _sample_event("disposal-ext", datetime(2024, 1, 5, 10, 30, 0, tzinfo=timezone.utc))
+def test_replace_acquisition_disposal_projection(
+    projection_repo: AcquisitionDisposalProjectionRepository,
+    sample_event: SampleEventFactory,
+) -> None:
+    acquisition_event = sample_event("acq-ext", datetime(2024, 1, 4, 9, 0, 0, tzinfo=timezone.utc))
+    disposal_event = sample_event("disposal-ext", datetime(2024, 1, 5, 10, 30, 0, tzinfo=timezone.utc))
     lots = [
         _acquisition_lot_from_event(acquisition_event, leg_index=0, cost_per_unit=Decimal("1.23")),
         _acquisition_lot_from_event(acquisition_event, leg_index=1, cost_per_unit=Decimal("2.34")),
@@ -180,9 +213,10 @@ def test_replace_acquisition_disposal_projection(projection_repo: AcquisitionDis
 
 def test_replace_acquisition_disposal_projection_clears_previous_rows(
     projection_repo: AcquisitionDisposalProjectionRepository,
+    sample_event: SampleEventFactory,
 ) -> None:
-    first_acquisition_event = _sample_event("first-acq-ext", datetime(2024, 1, 4, 9, 0, 0, tzinfo=timezone.utc))
-    first_disposal_event = _sample_event("first-disposal-ext", datetime(2024, 1, 5, 10, 30, 0, tzinfo=timezone.utc))
+    first_acquisition_event = sample_event("first-acq-ext", datetime(2024, 1, 4, 9, 0, 0, tzinfo=timezone.utc))
+    first_disposal_event = sample_event("first-disposal-ext", datetime(2024, 1, 5, 10, 30, 0, tzinfo=timezone.utc))
     stale_lot = _acquisition_lot_from_event(first_acquisition_event, leg_index=0, cost_per_unit=Decimal("1.23"))
     stale_link = _disposal_link_from_event(
         first_disposal_event,
@@ -193,7 +227,7 @@ def test_replace_acquisition_disposal_projection_clears_previous_rows(
     )
     projection_repo.replace(AcquisitionDisposalProjection(acquisition_lots=[stale_lot], disposal_links=[stale_link]))
 
-    replacement_event = _sample_event("replacement-acq-ext", datetime(2024, 1, 6, 9, 0, 0, tzinfo=timezone.utc))
+    replacement_event = sample_event("replacement-acq-ext", datetime(2024, 1, 6, 9, 0, 0, tzinfo=timezone.utc))
     replacement_lot = _acquisition_lot_from_event(replacement_event, leg_index=0, cost_per_unit=Decimal("4.56"))
     projection_repo.replace(AcquisitionDisposalProjection(acquisition_lots=[replacement_lot], disposal_links=[]))
 
@@ -205,12 +239,12 @@ def test_replace_acquisition_disposal_projection_clears_previous_rows(
 def test_persist_tax_events(tax_repo: TaxEventRepository) -> None:
     taxable_events = [
         TaxEvent(
-            source_id=DisposalId(uuid4()),
+            source_id=DisposalId(UUID(int=1)),
             kind=TaxEventKind.DISPOSAL,
             taxable_gain=Decimal("123.45"),
         ),
         TaxEvent(
-            source_id=LotId(uuid4()),
+            source_id=LotId(UUID(int=2)),
             kind=TaxEventKind.REWARD,
             taxable_gain=Decimal("67.89"),
         ),
@@ -227,11 +261,14 @@ def test_persist_tax_events(tax_repo: TaxEventRepository) -> None:
         assert reloaded.taxable_gain == expected.taxable_gain
 
 
-def test_persist_corrected_ledger_events(corrected_repo: CorrectedLedgerEventRepository) -> None:
+def test_persist_corrected_ledger_events(
+    corrected_repo: CorrectedLedgerEventRepository,
+    sample_event: SampleEventFactory,
+) -> None:
     external_id = "corrected-ext"
     timestamp = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
     note = "depositAll"
-    event = _sample_event(external_id, timestamp, note=note)
+    event = sample_event(external_id, timestamp, note=note)
 
     corrected_repo.create_many([event])
 
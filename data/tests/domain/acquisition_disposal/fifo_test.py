@@ -1,6 +1,6 @@
 from collections import deque
 from decimal import Decimal
-from uuid import uuid4
+from itertools import count
 
 import pytest
 
@@ -21,12 +21,13 @@ from domain.ledger import AssetId, EventLocation, EventOrigin
 from tests.constants import BASE_WALLET, BTC, EUR, USD
 from tests.domain.acquisition_disposal.helpers import BASE_TIMESTAMP, EXOTIC
 
-EVENT_ORIGIN = EventOrigin(location=EventLocation.INTERNAL, external_id=str(uuid4()))
+EVENT_ORIGIN = EventOrigin(location=EventLocation.INTERNAL, external_id="fifo-event")
+_LOT_COUNTER = count()
 
 
 def _open_lot(*, asset_id: AssetId, quantity: str, cost_per_unit: str) -> _LotBalance:
     lot = AcquisitionLot(
-        event_origin=EventOrigin(location=EventLocation.KRAKEN, external_id=str(uuid4())),
+        event_origin=EventOrigin(location=EventLocation.KRAKEN, external_id=f"open-lot-{next(_LOT_COUNTER)}"),
         account_chain_id=KRAKEN_ACCOUNT_ID,
         asset_id=asset_id,
         is_fee=False,
@@ -37,16 +38,38 @@ def _open_lot(*, asset_id: AssetId, quantity: str, cost_per_unit: str) -> _LotBa
     return _LotBalance(lot=lot, remaining_quantity=Decimal(quantity))
 
 
+def _group(asset_id: AssetId, quantity: Decimal) -> _ProjectedAssetResidualGroup:
+    return _ProjectedAssetResidualGroup(
+        asset_id=asset_id,
+        residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=quantity)],
+    )
+
+
+def _match_btc_sequence(steps: list[tuple[Decimal, Decimal]]) -> tuple[list[AcquisitionLot], list[DisposalLink]]:
+    """Run `(signed quantity, price)` BTC steps through FIFO matching with shared open-lot state."""
+    open_lots_by_asset: dict[AssetId, deque[_LotBalance]] = {}
+    acquisitions: list[AcquisitionLot] = []
+    disposals: list[DisposalLink] = []
+
+    for quantity, price in steps:
+        match_event_fifo(
+            _ProjectedEvent(non_fee_groups=[_group(BTC, quantity)], fee_groups=[]),
+            prices={BTC: price},
+            event_origin=EVENT_ORIGIN,
+            timestamp=BASE_TIMESTAMP,
+            open_lots_by_asset=open_lots_by_asset,
+            acquisitions=acquisitions,
+            disposals=disposals,
+        )
+
+    return acquisitions, disposals
+
+
 def test_single_acquisition() -> None:
     quantity = Decimal("0.5")
     cost = Decimal("40000")
     projected_event = _ProjectedEvent(
-        non_fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=BTC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=quantity)],
-            ),
-        ],
+        non_fee_groups=[_group(BTC, quantity)],
         fee_groups=[],
     )
     acquisitions: list[AcquisitionLot] = []
@@ -63,12 +86,8 @@ def test_single_acquisition() -> None:
     )
 
     assert disposals == []
-    assert len(acquisitions) == 1
-
-    new_lot = acquisitions[0]
-    assert new_lot.quantity_acquired == quantity
-    assert new_lot.asset_id == BTC
-    assert new_lot.cost_per_unit == cost
+    (new_lot,) = acquisitions
+    assert (new_lot.asset_id, new_lot.quantity_acquired, new_lot.cost_per_unit) == (BTC, quantity, cost)
 
 
 def test_multiple_acquisitions() -> None:
@@ -76,46 +95,8 @@ def test_multiple_acquisitions() -> None:
     second_quantity = Decimal("0.3")
     first_cost = Decimal("40000")
     second_cost = Decimal("45000")
-    first_event = _ProjectedEvent(
-        non_fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=BTC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=first_quantity)],
-            ),
-        ],
-        fee_groups=[],
-    )
-    second_event = _ProjectedEvent(
-        non_fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=BTC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=second_quantity)],
-            ),
-        ],
-        fee_groups=[],
-    )
-    open_lots_by_asset: dict[AssetId, deque[_LotBalance]] = {}
-    acquisitions: list[AcquisitionLot] = []
-    disposals: list[DisposalLink] = []
 
-    match_event_fifo(
-        first_event,
-        prices={BTC: first_cost},
-        event_origin=EVENT_ORIGIN,
-        timestamp=BASE_TIMESTAMP,
-        open_lots_by_asset=open_lots_by_asset,
-        acquisitions=acquisitions,
-        disposals=disposals,
-    )
-    match_event_fifo(
-        second_event,
-        prices={BTC: second_cost},
-        event_origin=EVENT_ORIGIN,
-        timestamp=BASE_TIMESTAMP,
-        open_lots_by_asset=open_lots_by_asset,
-        acquisitions=acquisitions,
-        disposals=disposals,
-    )
+    acquisitions, disposals = _match_btc_sequence([(first_quantity, first_cost), (second_quantity, second_cost)])
 
     assert disposals == []
     assert [(lot.quantity_acquired, lot.cost_per_unit) for lot in acquisitions] == [
@@ -129,53 +110,19 @@ def test_single_disposal() -> None:
     disposed_quantity = Decimal("0.2")
     acquisition_price = Decimal("40000")
     disposal_price = Decimal("45000")
-    acquisition_event = _ProjectedEvent(
-        non_fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=BTC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=acquired_quantity)],
-            ),
-        ],
-        fee_groups=[],
-    )
-    disposal_event = _ProjectedEvent(
-        non_fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=BTC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=-disposed_quantity)],
-            ),
-        ],
-        fee_groups=[],
-    )
-    open_lots_by_asset: dict[AssetId, deque[_LotBalance]] = {}
-    acquisitions: list[AcquisitionLot] = []
-    disposals: list[DisposalLink] = []
 
-    match_event_fifo(
-        acquisition_event,
-        prices={BTC: acquisition_price},
-        event_origin=EVENT_ORIGIN,
-        timestamp=BASE_TIMESTAMP,
-        open_lots_by_asset=open_lots_by_asset,
-        acquisitions=acquisitions,
-        disposals=disposals,
-    )
-    match_event_fifo(
-        disposal_event,
-        prices={BTC: disposal_price},
-        event_origin=EVENT_ORIGIN,
-        timestamp=BASE_TIMESTAMP,
-        open_lots_by_asset=open_lots_by_asset,
-        acquisitions=acquisitions,
-        disposals=disposals,
+    acquisitions, disposals = _match_btc_sequence(
+        [(acquired_quantity, acquisition_price), (-disposed_quantity, disposal_price)]
     )
 
     (acquisition_lot,) = acquisitions
     (disposal_link,) = disposals
 
-    assert disposal_link.lot_id == acquisition_lot.id
-    assert disposal_link.quantity_used == disposed_quantity
-    assert disposal_link.proceeds_total == disposed_quantity * disposal_price
+    assert (disposal_link.lot_id, disposal_link.quantity_used, disposal_link.proceeds_total) == (
+        acquisition_lot.id,
+        disposed_quantity,
+        disposed_quantity * disposal_price,
+    )
 
 
 def test_multiple_disposals() -> None:
@@ -185,63 +132,13 @@ def test_multiple_disposals() -> None:
     acquisition_price = Decimal("40000")
     first_disposal_price = Decimal("45000")
     second_disposal_price = Decimal("42000")
-    acquisition_event = _ProjectedEvent(
-        non_fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=BTC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=acquired_quantity)],
-            ),
-        ],
-        fee_groups=[],
-    )
-    first_disposal_event = _ProjectedEvent(
-        non_fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=BTC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=-first_disposed_quantity)],
-            ),
-        ],
-        fee_groups=[],
-    )
-    second_disposal_event = _ProjectedEvent(
-        non_fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=BTC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=-second_disposed_quantity)],
-            ),
-        ],
-        fee_groups=[],
-    )
-    open_lots_by_asset: dict[AssetId, deque[_LotBalance]] = {}
-    acquisitions: list[AcquisitionLot] = []
-    disposals: list[DisposalLink] = []
 
-    match_event_fifo(
-        acquisition_event,
-        prices={BTC: acquisition_price},
-        event_origin=EVENT_ORIGIN,
-        timestamp=BASE_TIMESTAMP,
-        open_lots_by_asset=open_lots_by_asset,
-        acquisitions=acquisitions,
-        disposals=disposals,
-    )
-    match_event_fifo(
-        first_disposal_event,
-        prices={BTC: first_disposal_price},
-        event_origin=EVENT_ORIGIN,
-        timestamp=BASE_TIMESTAMP,
-        open_lots_by_asset=open_lots_by_asset,
-        acquisitions=acquisitions,
-        disposals=disposals,
-    )
-    match_event_fifo(
-        second_disposal_event,
-        prices={BTC: second_disposal_price},
-        event_origin=EVENT_ORIGIN,
-        timestamp=BASE_TIMESTAMP,
-        open_lots_by_asset=open_lots_by_asset,
-        acquisitions=acquisitions,
-        disposals=disposals,
+    acquisitions, disposals = _match_btc_sequence(
+        [
+            (acquired_quantity, acquisition_price),
+            (-first_disposed_quantity, first_disposal_price),
+            (-second_disposed_quantity, second_disposal_price),
+        ]
     )
 
     (acquisition_lot,) = acquisitions
@@ -259,63 +156,13 @@ def test_disposal_that_disposes_multiple_acquisitions() -> None:
     first_price = Decimal("20000")
     second_price = Decimal("30000")
     disposal_price = Decimal("40000")
-    first_acquisition_event = _ProjectedEvent(
-        non_fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=BTC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=first_quantity)],
-            ),
-        ],
-        fee_groups=[],
-    )
-    second_acquisition_event = _ProjectedEvent(
-        non_fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=BTC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=second_quantity)],
-            ),
-        ],
-        fee_groups=[],
-    )
-    disposal_event = _ProjectedEvent(
-        non_fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=BTC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=-disposed_quantity)],
-            ),
-        ],
-        fee_groups=[],
-    )
-    open_lots_by_asset: dict[AssetId, deque[_LotBalance]] = {}
-    acquisitions: list[AcquisitionLot] = []
-    disposals: list[DisposalLink] = []
 
-    match_event_fifo(
-        first_acquisition_event,
-        prices={BTC: first_price},
-        event_origin=EVENT_ORIGIN,
-        timestamp=BASE_TIMESTAMP,
-        open_lots_by_asset=open_lots_by_asset,
-        acquisitions=acquisitions,
-        disposals=disposals,
-    )
-    match_event_fifo(
-        second_acquisition_event,
-        prices={BTC: second_price},
-        event_origin=EVENT_ORIGIN,
-        timestamp=BASE_TIMESTAMP,
-        open_lots_by_asset=open_lots_by_asset,
-        acquisitions=acquisitions,
-        disposals=disposals,
-    )
-    match_event_fifo(
-        disposal_event,
-        prices={BTC: disposal_price},
-        event_origin=EVENT_ORIGIN,
-        timestamp=BASE_TIMESTAMP,
-        open_lots_by_asset=open_lots_by_asset,
-        acquisitions=acquisitions,
-        disposals=disposals,
+    acquisitions, disposals = _match_btc_sequence(
+        [
+            (first_quantity, first_price),
+            (second_quantity, second_price),
+            (-disposed_quantity, disposal_price),
+        ]
     )
 
     first_lot, second_lot = acquisitions
@@ -328,12 +175,7 @@ def test_disposal_that_disposes_multiple_acquisitions() -> None:
 
 def test_raises_when_open_lots_are_insufficient() -> None:
     projected_event = _ProjectedEvent(
-        non_fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=BTC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=Decimal("-1"))],
-            ),
-        ],
+        non_fee_groups=[_group(BTC, Decimal("-1"))],
         fee_groups=[],
     )
 
@@ -358,18 +200,9 @@ def test_skips_fiat_groups() -> None:
     btc_price = Decimal("40000")
     projected_event = _ProjectedEvent(
         non_fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=BTC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=btc_quantity)],
-            ),
-            _ProjectedAssetResidualGroup(
-                asset_id=EUR,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=Decimal("100"))],
-            ),
-            _ProjectedAssetResidualGroup(
-                asset_id=USD,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=Decimal("-50"))],
-            ),
+            _group(BTC, btc_quantity),
+            _group(EUR, Decimal("100")),
+            _group(USD, Decimal("-50")),
         ],
         fee_groups=[],
     )
@@ -386,30 +219,16 @@ def test_skips_fiat_groups() -> None:
         disposals=disposals,
     )
 
-    assert len(acquisitions) == 1
     assert disposals == []
-
     (new_lot,) = acquisitions
-    assert new_lot.asset_id == BTC
-    assert new_lot.quantity_acquired == btc_quantity
-    assert new_lot.cost_per_unit == btc_price
+    assert (new_lot.asset_id, new_lot.quantity_acquired, new_lot.cost_per_unit) == (BTC, btc_quantity, btc_price)
 
 
 def test_processes_disposals_before_same_event_acquisitions() -> None:
     existing_lot = _open_lot(asset_id=EXOTIC, quantity="5", cost_per_unit="10")
     projected_event = _ProjectedEvent(
-        non_fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=EXOTIC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=Decimal("100"))],
-            ),
-        ],
-        fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=EXOTIC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=Decimal("-1"))],
-            ),
-        ],
+        non_fee_groups=[_group(EXOTIC, Decimal("100"))],
+        fee_groups=[_group(EXOTIC, Decimal("-1"))],
     )
     acquisitions: list[AcquisitionLot] = []
     disposals: list[DisposalLink] = []
@@ -427,26 +246,14 @@ def test_processes_disposals_before_same_event_acquisitions() -> None:
     (fee_link,) = disposals
     (new_lot,) = acquisitions
 
-    assert fee_link.lot_id == existing_lot.lot.id
-    assert fee_link.quantity_used == Decimal("1")
-    assert fee_link.is_fee is True
+    assert (fee_link.lot_id, fee_link.quantity_used, fee_link.is_fee) == (existing_lot.lot.id, Decimal("1"), True)
     assert new_lot.quantity_acquired == Decimal("100")
 
 
 def test_does_not_allow_fee_disposal_to_consume_same_event_non_fee_acquisition() -> None:
     projected_event = _ProjectedEvent(
-        non_fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=EXOTIC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=Decimal("100"))],
-            ),
-        ],
-        fee_groups=[
-            _ProjectedAssetResidualGroup(
-                asset_id=EXOTIC,
-                residuals=[_ProjectedResidualLeg(account_chain_id=BASE_WALLET, quantity=Decimal("-1"))],
-            ),
-        ],
+        non_fee_groups=[_group(EXOTIC, Decimal("100"))],
+        fee_groups=[_group(EXOTIC, Decimal("-1"))],
     )
 
     with pytest.raises(AcquisitionDisposalProjectionError, match="Not enough open lots") as exc_info:
@@ -1,10 +1,11 @@
 from datetime import datetime, timedelta, timezone
-from uuid import uuid4
+from itertools import count
 
 from domain.ledger import AssetId, EventLocation, EventOrigin, LedgerEvent, LedgerLeg
 
 BASE_TIMESTAMP = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
 EXOTIC = AssetId("EXOTIC")
+_EVENT_COUNTER = count()
 
 
 def make_event(
@@ -15,9 +16,11 @@ def make_event(
     timestamp: datetime | None = None,
 ) -> LedgerEvent:
     event_timestamp = timestamp or (BASE_TIMESTAMP + timedelta(days=offset_days))
+    if external_id is None:
+        external_id = f"test-event-{next(_EVENT_COUNTER)}"
     return LedgerEvent(
         timestamp=event_timestamp,
-        event_origin=EventOrigin(location=EventLocation.INTERNAL, external_id=external_id or str(uuid4())),
+        event_origin=EventOrigin(location=EventLocation.INTERNAL, external_id=external_id),
         ingestion="test",
         legs=legs,
     )
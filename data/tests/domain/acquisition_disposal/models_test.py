@@ -1,5 +1,5 @@
 from decimal import Decimal
-from uuid import uuid4
+from uuid import UUID
 
 from accounts import KRAKEN_ACCOUNT_ID
 from domain.acquisition_disposal.models import AbstractAcquisitionDisposal, AcquisitionLot, DisposalLink
@@ -48,7 +48,7 @@ def test_disposal_link_accepts_negative_proceeds() -> None:
         asset_id=BTC,
         is_fee=False,
         timestamp=BASE_TIMESTAMP,
-        lot_id=LotId(uuid4()),
+        lot_id=LotId(UUID(int=1)),
         quantity_used=Decimal("1"),
         proceeds_total=Decimal("-2500"),
     )
@@ -7,8 +7,9 @@ from domain.acquisition_disposal.errors import (
     AcquisitionDisposalProjectionError,
     AcquisitionDisposalValuationError,
 )
-from domain.acquisition_disposal.projector import AcquisitionDisposalProjector
-from domain.ledger import AssetId
+from domain.acquisition_disposal.models import AcquisitionLot
+from domain.acquisition_disposal.projector import AcquisitionDisposalProjection, AcquisitionDisposalProjector
+from domain.ledger import AssetId, EventOrigin
 from domain.pricing import PriceProvider
 from tests.constants import EUR, USDC
 from tests.domain.acquisition_disposal.helpers import BASE_TIMESTAMP, make_event
@@ -44,6 +45,13 @@ class FailingPriceProvider(PriceProvider):
         raise RuntimeError("price backend failed")
 
 
+def _lot_for(projection: AcquisitionDisposalProjection, event_origin: EventOrigin, asset_id: AssetId) -> AcquisitionLot:
+    (lot,) = [
+        lot for lot in projection.acquisition_lots if lot.event_origin == event_origin and lot.asset_id == asset_id
+    ]
+    return lot
+
+
 def test_valuation_error_includes_event_context() -> None:
     external_id = "projector-unpriced"
     event = make_event(
@@ -81,11 +89,8 @@ def test_override_prices_otherwise_unpriceable_acquisition() -> None:
         overrides_by_event_origin=overrides_by_event_origin,
     ).project(events=[event])
 
-    assert len(projection.acquisition_lots) == 1
-    lot = projection.acquisition_lots[0]
-    assert lot.asset_id == LP
-    assert lot.quantity_acquired == lp_quantity
-    assert lot.cost_per_unit == lp_override_rate
+    (lot,) = projection.acquisition_lots
+    assert (lot.asset_id, lot.quantity_acquired, lot.cost_per_unit) == (LP, lp_quantity, lp_override_rate)
 
 
 def test_unpriceable_reference_asset_error_includes_event_context() -> None:
@@ -154,7 +159,7 @@ def test_one_sided_event_borrows_rate_from_closest_standard_anchor(
         overrides_by_event_origin={},
     ).project(events=[past, target, future])
 
-    target_lot = next(lot for lot in projection.acquisition_lots if lot.event_origin == target.event_origin)
+    target_lot = _lot_for(projection, target.event_origin, LP)
 
     assert target_lot.cost_per_unit == expected_rate
 
@@ -188,7 +193,7 @@ def test_equal_distance_anchors_are_selected_by_event_origin() -> None:
         },
     ).project(events=[second, first, target])
 
-    target_lot = next(lot for lot in projection.acquisition_lots if lot.event_origin == target.event_origin)
+    target_lot = _lot_for(projection, target.event_origin, LP)
 
     assert target_lot.cost_per_unit == first_rate
 
@@ -215,9 +220,7 @@ def test_two_missing_rates_borrow_one_and_remainder_solve_the_other() -> None:
         overrides_by_event_origin={anchor.event_origin: {LP_A: anchor_rate}},
     ).project(events=[anchor, target])
 
-    target_lot = next(
-        lot for lot in projection.acquisition_lots if lot.event_origin == target.event_origin and lot.asset_id == LP_B
-    )
+    target_lot = _lot_for(projection, target.event_origin, LP_B)
 
     assert target_lot.cost_per_unit == expected_acquired_rate
 
@@ -282,7 +285,7 @@ def test_standard_remainder_solved_rate_can_anchor_another_event() -> None:
         overrides_by_event_origin={},
     ).project(events=[anchor, target])
 
-    target_lot = next(lot for lot in projection.acquisition_lots if lot.event_origin == target.event_origin)
+    target_lot = _lot_for(projection, target.event_origin, LP)
 
     assert target_lot.cost_per_unit == expected_rate
 
@@ -345,9 +348,7 @@ def test_same_anchor_event_uses_asset_id_to_choose_first_borrowed_rate() -> None
         overrides_by_event_origin={anchor.event_origin: {LP_A: first_rate, LP_B: second_rate}},
     ).project(events=[anchor, target])
 
-    target_lot = next(
-        lot for lot in projection.acquisition_lots if lot.event_origin == target.event_origin and lot.asset_id == LP_B
-    )
+    target_lot = _lot_for(projection, target.event_origin, LP_B)
 
     assert target_lot.cost_per_unit == first_rate
 
@@ -39,10 +39,8 @@ def test_non_fee_eur_remains_in_non_fee_groups() -> None:
     eur_group = next(group for group in projected_event.non_fee_groups if group.asset_id == EUR)
 
     assert {group.asset_id for group in projected_event.non_fee_groups} == {ETH, EUR}
-    assert len(eth_group.residuals) == 1
-    assert eth_group.residuals[0].quantity == acquisition_quantity
-    assert len(eur_group.residuals) == 1
-    assert eur_group.residuals[0].quantity == eur_quantity
+    assert tuple(residual.quantity for residual in eth_group.residuals) == (acquisition_quantity,)
+    assert tuple(residual.quantity for residual in eur_group.residuals) == (eur_quantity,)
 
 
 def test_fee_group_stays_separate_when_fee_asset_matches_non_fee_asset() -> None:
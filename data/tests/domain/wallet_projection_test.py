@@ -3,9 +3,9 @@ from decimal import Decimal
 import pytest
 
 from accounts import KRAKEN_ACCOUNT_ID
-from domain.ledger import LedgerLeg
 from domain.wallet_projection import WalletProjectionError, WalletProjector
 from tests.constants import BASE_WALLET, ETH, EUR, LEDGER_WALLET
+from tests.helpers.ledger import make_leg
 from tests.helpers.time_utils import make_event
 
 
@@ -21,24 +21,24 @@ def test_wallet_projector_processes_events_across_multiple_accounts(
     sold_eth = Decimal("0.3")
 
     events = [
-        make_event(legs=[LedgerLeg(asset_id=EUR, quantity=starting_eur, account_chain_id=KRAKEN_ACCOUNT_ID)]),
+        make_event(legs=[make_leg(asset_id=EUR, quantity=starting_eur, account_chain_id=KRAKEN_ACCOUNT_ID)]),
         make_event(
             legs=[
-                LedgerLeg(asset_id=ETH, quantity=acquired_eth, account_chain_id=KRAKEN_ACCOUNT_ID),
-                LedgerLeg(asset_id=EUR, quantity=-spent_eur, account_chain_id=KRAKEN_ACCOUNT_ID),
+                make_leg(asset_id=ETH, quantity=acquired_eth, account_chain_id=KRAKEN_ACCOUNT_ID),
+                make_leg(asset_id=EUR, quantity=-spent_eur, account_chain_id=KRAKEN_ACCOUNT_ID),
             ]
         ),
         make_event(
             legs=[
-                LedgerLeg(asset_id=ETH, quantity=-transfer_eth, account_chain_id=KRAKEN_ACCOUNT_ID),
-                LedgerLeg(asset_id=ETH, quantity=transfer_eth, account_chain_id=LEDGER_WALLET),
+                make_leg(asset_id=ETH, quantity=-transfer_eth, account_chain_id=KRAKEN_ACCOUNT_ID),
+                make_leg(asset_id=ETH, quantity=transfer_eth, account_chain_id=LEDGER_WALLET),
             ]
         ),
         make_event(
             legs=[
-                LedgerLeg(asset_id=ETH, quantity=-sold_eth, account_chain_id=LEDGER_WALLET),
-                LedgerLeg(asset_id=EUR, quantity=received_eur, account_chain_id=LEDGER_WALLET),
-                LedgerLeg(asset_id=EUR, quantity=-fee_eur, account_chain_id=LEDGER_WALLET, is_fee=True),
+                make_leg(asset_id=ETH, quantity=-sold_eth, account_chain_id=LEDGER_WALLET),
+                make_leg(asset_id=EUR, quantity=received_eur, account_chain_id=LEDGER_WALLET),
+                make_leg(asset_id=EUR, quantity=-fee_eur, account_chain_id=LEDGER_WALLET, is_fee=True),
             ]
         ),
     ]
@@ -67,11 +67,11 @@ def test_wallet_projector_nets_same_event_deltas_across_distinct_leg_identities(
     remaining_quantity = starting_quantity + received_quantity - spent_quantity
 
     events = [
-        make_event(legs=[LedgerLeg(asset_id=ETH, quantity=starting_quantity, account_chain_id=KRAKEN_ACCOUNT_ID)]),
+        make_event(legs=[make_leg(asset_id=ETH, quantity=starting_quantity, account_chain_id=KRAKEN_ACCOUNT_ID)]),
         make_event(
             legs=[
-                LedgerLeg(asset_id=ETH, quantity=received_quantity, account_chain_id=KRAKEN_ACCOUNT_ID),
-                LedgerLeg(
+                make_leg(asset_id=ETH, quantity=received_quantity, account_chain_id=KRAKEN_ACCOUNT_ID),
+                make_leg(
                     asset_id=ETH,
                     quantity=-spent_quantity,
                     account_chain_id=KRAKEN_ACCOUNT_ID,
@@ -83,11 +83,9 @@ def test_wallet_projector_nets_same_event_deltas_across_distinct_leg_identities(
 
     balances = wallet_projector.project(events)
 
-    assert len(balances) == 1
-    balance = balances[0]
-    assert balance.account_chain_id == KRAKEN_ACCOUNT_ID
-    assert balance.asset_id == ETH
-    assert balance.balance == remaining_quantity
+    assert [(balance.account_chain_id, balance.asset_id, balance.balance) for balance in balances] == [
+        (KRAKEN_ACCOUNT_ID, ETH, remaining_quantity)
+    ]
 
 
 def test_wallet_projector_raises_and_keeps_balances_before_failed_event(wallet_projector: WalletProjector) -> None:
@@ -95,11 +93,11 @@ def test_wallet_projector_raises_and_keeps_balances_before_failed_event(wallet_p
     attempted_quantity = Decimal("1.5")
     missing_quantity = attempted_quantity - starting_quantity
     events = [
-        make_event(legs=[LedgerLeg(asset_id=ETH, quantity=starting_quantity, account_chain_id=KRAKEN_ACCOUNT_ID)]),
+        make_event(legs=[make_leg(asset_id=ETH, quantity=starting_quantity, account_chain_id=KRAKEN_ACCOUNT_ID)]),
         make_event(
             legs=[
-                LedgerLeg(asset_id=ETH, quantity=-attempted_quantity, account_chain_id=KRAKEN_ACCOUNT_ID),
-                LedgerLeg(asset_id=ETH, quantity=attempted_quantity, account_chain_id=LEDGER_WALLET),
+                make_leg(asset_id=ETH, quantity=-attempted_quantity, account_chain_id=KRAKEN_ACCOUNT_ID),
+                make_leg(asset_id=ETH, quantity=attempted_quantity, account_chain_id=LEDGER_WALLET),
             ]
         ),
     ]
@@ -109,13 +107,14 @@ def test_wallet_projector_raises_and_keeps_balances_before_failed_event(wallet_p
 
     error = excinfo.value
     assert error.event == events[1].event_origin
-    assert len(error.issues) == 1
-    issue = error.issues[0]
-    assert issue.account_chain_id == KRAKEN_ACCOUNT_ID
-    assert issue.asset_id == ETH
-    assert issue.attempted_delta == -attempted_quantity
-    assert issue.available_balance == starting_quantity
-    assert issue.missing_balance == missing_quantity
+    (issue,) = error.issues
+    assert (
+        issue.account_chain_id,
+        issue.asset_id,
+        issue.attempted_delta,
+        issue.available_balance,
+        issue.missing_balance,
+    ) == (KRAKEN_ACCOUNT_ID, ETH, -attempted_quantity, starting_quantity, missing_quantity)
     assert [(balance.account_chain_id, balance.asset_id, balance.balance) for balance in wallet_projector.balances] == [
         (KRAKEN_ACCOUNT_ID, ETH, starting_quantity)
     ]
@@ -131,14 +130,14 @@ def test_wallet_projector_collects_all_blocking_issues_from_failed_event(
     events = [
         make_event(
             legs=[
-                LedgerLeg(asset_id=ETH, quantity=eth_available, account_chain_id=KRAKEN_ACCOUNT_ID),
-                LedgerLeg(asset_id=EUR, quantity=eur_available, account_chain_id=BASE_WALLET),
+                make_leg(asset_id=ETH, quantity=eth_available, account_chain_id=KRAKEN_ACCOUNT_ID),
+                make_leg(asset_id=EUR, quantity=eur_available, account_chain_id=BASE_WALLET),
             ]
         ),
         make_event(
             legs=[
-                LedgerLeg(asset_id=ETH, quantity=-eth_attempted, account_chain_id=KRAKEN_ACCOUNT_ID),
-                LedgerLeg(asset_id=EUR, quantity=-eur_attempted, account_chain_id=BASE_WALLET),
+                make_leg(asset_id=ETH, quantity=-eth_attempted, account_chain_id=KRAKEN_ACCOUNT_ID),
+                make_leg(asset_id=EUR, quantity=-eur_attempted, account_chain_id=BASE_WALLET),
             ]
         ),
     ]
@@ -158,8 +157,8 @@ def test_wallet_projector_excludes_zero_balances(wallet_projector: WalletProject
     acquired_quantity = Decimal("2.0")
     disposed_quantity = acquired_quantity
     events = [
-        make_event(legs=[LedgerLeg(asset_id=ETH, quantity=acquired_quantity, account_chain_id=KRAKEN_ACCOUNT_ID)]),
-        make_event(legs=[LedgerLeg(asset_id=ETH, quantity=-disposed_quantity, account_chain_id=KRAKEN_ACCOUNT_ID)]),
+        make_event(legs=[make_leg(asset_id=ETH, quantity=acquired_quantity, account_chain_id=KRAKEN_ACCOUNT_ID)]),
+        make_event(legs=[make_leg(asset_id=ETH, quantity=-disposed_quantity, account_chain_id=KRAKEN_ACCOUNT_ID)]),
     ]
 
     balances = wallet_projector.project(events)
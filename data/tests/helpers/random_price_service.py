@@ -6,6 +6,8 @@ from decimal import Decimal
 from domain.ledger import AssetId
 from domain.pricing import PriceProvider, PriceRecord, PriceSource
 
+_PRICE_SCALE = Decimal("0.01")
+
 
 class DeterministicRandomPriceSource(PriceSource):
     def __init__(
@@ -27,6 +29,10 @@ class DeterministicRandomPriceSource(PriceSource):
         self.min_price = min_price
         self.max_price = max_price
         self.source_name = source_name
+        # Bounds are fixed per source and one generator is reseeded per rate, so no per-call setup is repeated.
+        self._min_scaled = self._scale_to_int(min_price, _PRICE_SCALE)
+        self._max_scaled = self._scale_to_int(max_price, _PRICE_SCALE)
+        self._rng = random.Random()
 
     def fetch_record(self, base_id: AssetId, quote_id: AssetId, timestamp: datetime) -> PriceRecord:
         rate = self._generate_rate(base_id=base_id, quote_id=quote_id, timestamp=timestamp)
@@ -44,12 +50,9 @@ class DeterministicRandomPriceSource(PriceSource):
         digest_input = "|".join([base_id.upper(), quote_id.upper(), timestamp.isoformat(timespec="seconds")])
         digest = hashlib.sha256(digest_input.encode("utf-8")).digest()
         seed = self.seed ^ int.from_bytes(digest, "big", signed=False)
-        rng = random.Random(seed)
-        scale = Decimal("0.01")
-        min_scaled = self._scale_to_int(self.min_price, scale)
-        max_scaled = self._scale_to_int(self.max_price, scale)
-        selected = rng.randint(min_scaled, max_scaled)
-        return (Decimal(selected) * scale).quantize(scale)
+        self._rng.seed(seed)
+        selected = self._rng.randint(self._min_scaled, self._max_scaled)
+        return (Decimal(selected) * _PRICE_SCALE).quantize(_PRICE_SCALE)
 
     @staticmethod
     def _scale_to_int(value: Decimal, scale: Decimal) -> int:
@@ -74,10 +77,17 @@ class TestPriceService(PriceProvider):
             max_price=max_price,
             source_name=source_name,
         )
+        # Rates are a pure function of (seed, pair, timestamp), so repeated lookups skip the hash + RNG walk.
+        self._rates: dict[tuple[AssetId, AssetId, datetime], Decimal] = {}
 
     def rate(self, base_id: AssetId, quote_id: AssetId, timestamp: datetime) -> Decimal:
         if base_id.upper() == quote_id.upper():
             return Decimal(1)
+        key = (base_id, quote_id, timestamp)
+        cached = self._rates.get(key)
+        if cached is not None:
+            return cached
         snapshot = self._source.fetch_record(base_id=base_id, quote_id=quote_id, timestamp=timestamp)
         assert snapshot.rate is not None
+        self._rates[key] = snapshot.rate
         return snapshot.rate
@@ -0,0 +1,14 @@
+from datetime import datetime, timezone
+
+from tests.constants import BTC, EUR
+from tests.helpers.random_price_service import TestPriceService
+
+
+def test_price_service_rate_is_deterministic_and_memoized() -> None:
+    timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    service = TestPriceService(seed=1)
+
+    first = service.rate(BTC, EUR, timestamp)
+
+    assert service.rate(BTC, EUR, timestamp) is first
+    assert TestPriceService(seed=1).rate(BTC, EUR, timestamp) == first
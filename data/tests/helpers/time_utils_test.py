@@ -7,24 +7,21 @@ from tests.constants import ETH
 from tests.helpers.time_utils import TimeGenerator, make_event
 
 
-def test_time_generator_increases_with_seed() -> None:
-    rng = Random(42)
-    gen = TimeGenerator(_rng=rng)
+def _take(count: int, seed: int) -> list[datetime]:
+    gen = TimeGenerator(_rng=Random(seed))
+    return [gen() for _ in range(count)]
+
 
-    ts1 = gen()
-    ts2 = gen()
-    ts3 = gen()
+def test_time_generator_increases_with_seed() -> None:
+    timestamps = _take(3, seed=42)
 
-    assert ts1 < ts2 < ts3
-    gaps = [(ts2 - ts1).total_seconds(), (ts3 - ts2).total_seconds()]
+    assert timestamps[0] < timestamps[1] < timestamps[2]
+    gaps = [(later - earlier).total_seconds() for earlier, later in zip(timestamps, timestamps[1:])]
     for gap in gaps:
         assert 5 <= gap <= 60
 
     # Deterministic given the same seed
-    gen_again = TimeGenerator(_rng=Random(42))
-    ts1_b, ts2_b, ts3_b = gen_again(), gen_again(), gen_again()
-    gaps_b = [(ts2_b - ts1_b).total_seconds(), (ts3_b - ts2_b).total_seconds()]
-    assert gaps == gaps_b
+    assert _take(3, seed=42) == timestamps
 
 
 def test_make_event_uses_generator_when_timestamp_missing() -> None:
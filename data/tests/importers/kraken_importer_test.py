@@ -1,12 +1,15 @@
-from csv import DictWriter
+import csv
+import io
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from itertools import count
+from operator import attrgetter
 from pathlib import Path
+from typing import Any
 
 import pytest
 
-from domain.ledger import EventLocation
+from domain.ledger import EventLocation, LedgerEvent
 from importers.kraken.kraken_importer import KrakenImporter, KrakenLedgerEntry
 
 FIELDNAMES = [
@@ -24,21 +27,28 @@ FIELDNAMES = [
 ]
 
 
-def write_csv(path: Path, rows: list[dict[str, str]]) -> None:
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = DictWriter(handle, fieldnames=FIELDNAMES)
-        writer.writeheader()
-        writer.writerows(rows)
+def csv_buffer(rows: list[dict[str, str]]) -> io.StringIO:
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    writer.writerow(FIELDNAMES)
+    writer.writerows([row[field] for field in FIELDNAMES] for row in rows)
+    buffer.seek(0)
+    return buffer
+
+
+def import_events(rows: list[dict[str, str]]) -> list[LedgerEvent]:
+    return KrakenImporter(handle=csv_buffer(rows)).load_events()
 
 
 def iso(ts: datetime) -> str:
     return ts.strftime("%Y-%m-%d %H:%M:%S")
 
 
-_txid_counter = count(1)
-_refid_counter = count(1)
+_row_counter = count(1)
 
-DEFAULT_TS = datetime(2024, 1, 1, 12, 0)
+DEFAULT_TS = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+PREPROCESS_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+ZERO = Decimal(0)
 
 
 def ledger_row(
@@ -55,10 +65,11 @@ def ledger_row(
     fee: str = "0",
     balance: str = "0",
 ) -> dict[str, str]:
+    row_number = next(_row_counter)
     if txid is None:
-        txid = f"TX{next(_txid_counter)}"
+        txid = f"TX{row_number}"
     if refid is None:
-        refid = f"REF{next(_refid_counter)}"
+        refid = f"REF{row_number}"
     return {
         "txid": txid,
         "refid": refid,
@@ -83,7 +94,7 @@ def _preprocess_entry(
     amount: Decimal,
     timestamp: datetime,
 ) -> KrakenLedgerEntry:
-    return KrakenLedgerEntry(
+    return KrakenLedgerEntry.model_construct(
         txid=txid,
         refid=refid,
         time=timestamp,
@@ -93,253 +104,177 @@ def _preprocess_entry(
         asset=asset,
         wallet="spot / main",
         amount=amount,
-        fee=Decimal(0),
-        balance=Decimal(0),
+        fee=ZERO,
+        balance=ZERO,
     )
 
 
-def test_importer_sets_origin_and_ingestion(tmp_path: Path) -> None:
+def test_importer_sets_origin_and_ingestion() -> None:
     refid = "REF-META-1"
-    file = tmp_path / "origin.csv"
-    write_csv(
-        file,
-        [
-            ledger_row(
-                refid=refid,
-                ts=DEFAULT_TS,
-                tx_type="deposit",
-                asset="EUR",
-                amount="10",
-            )
-        ],
+    entry = KrakenLedgerEntry.model_validate(
+        ledger_row(
+            refid=refid,
+            ts=DEFAULT_TS,
+            tx_type="deposit",
+            asset="EUR",
+            amount="10",
+        )
     )
 
-    event = KrakenImporter(str(file)).load_events()[0]
+    event = KrakenImporter(entries=[entry]).load_events()[0]
 
     assert event.event_origin.location == EventLocation.KRAKEN
     assert event.event_origin.external_id == refid
     assert event.ingestion == "kraken_ledger_csv"
 
 
-def test_deposit_fiat_becomes_deposit_event(tmp_path: Path) -> None:
-    amount = Decimal("100.5000")
-    fee = Decimal("0.2500")
-    file = tmp_path / "fiat_deposit.csv"
-    write_csv(
-        file,
-        [
-            ledger_row(
-                ts=DEFAULT_TS,
-                tx_type="deposit",
-                asset="EUR",
-                amount=str(amount),
-                fee=str(fee),
-                balance="100.5000",
-            )
-        ],
-    )
-
-    importer = KrakenImporter(str(file))
-    events = importer.load_events()
-
-    assert len(events) == 1
-    event = events[0]
-    assert event.timestamp == DEFAULT_TS.replace(tzinfo=timezone.utc)
-
-    assert len(event.legs) == 1
-    leg = event.legs[0]
-    assert leg.asset_id == "EUR"
-    assert leg.quantity == amount - fee
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"source_path": "ledger.csv", "entries": []}, {"entries": [], "handle": io.StringIO()}]
+)
+def test_importer_requires_exactly_one_source(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ValueError, match="exactly one of source_path, entries or handle"):
+        KrakenImporter(**kwargs)
 
 
-def test_deposit_fiat_without_fee(tmp_path: Path) -> None:
-    file = tmp_path / "fiat_deposit_no_fee.csv"
-    write_csv(
-        file,
-        [
-            ledger_row(
-                ts=DEFAULT_TS,
-                tx_type="deposit",
-                asset="EUR",
-                amount="500.0000",
-            )
-        ],
-    )
-
-    importer = KrakenImporter(str(file))
-    event = importer.load_events()[0]
-
-    assert len(event.legs) == 1
-    leg = event.legs[0]
-    assert leg.quantity == Decimal("500.0000")
-
-
-def test_deposit_crypto_becomes_transfer_event(tmp_path: Path) -> None:
-    file = tmp_path / "crypto_deposit.csv"
-    write_csv(
-        file,
-        [
-            ledger_row(
-                ts=DEFAULT_TS,
-                tx_type="deposit",
-                asset="ETH",
-                amount="2.5000000000",
-                balance="2.5000000000",
-            )
-        ],
-    )
-
-    importer = KrakenImporter(str(file))
-    events = importer.load_events()
-
-    assert len(events) == 1
-    event = events[0]
-    assert event.timestamp == DEFAULT_TS.replace(tzinfo=timezone.utc)
-
-    assert len(event.legs) == 1
-    leg = event.legs[0]
-    assert leg.asset_id == "ETH"
-    assert leg.quantity == Decimal("2.5")
-
-
-def test_deposit_crypto_with_fee(tmp_path: Path) -> None:
-    amount = Decimal("0.25000000")
-    fee = Decimal("0.00500000")
-    file = tmp_path / "crypto_deposit_with_fee.csv"
-    write_csv(
-        file,
-        [
-            ledger_row(
-                ts=DEFAULT_TS,
-                tx_type="deposit",
-                asset="BTC",
-                amount=str(amount),
-                fee=str(fee),
-            )
-        ],
-    )
+def test_importer_parses_handle_on_load() -> None:
+    row = ledger_row(ts=DEFAULT_TS, tx_type="deposit", asset="EUR", amount="10") | {"time": "2024-01-01"}
+    importer = KrakenImporter(handle=csv_buffer([row]))
 
-    importer = KrakenImporter(str(file))
-    event = importer.load_events()[0]
+    with pytest.raises(ValueError, match="YYYY-MM-DD HH:MM:SS"):
+        importer.load_events()
 
-    assert len(event.legs) == 1
-    leg = event.legs[0]
-    assert leg.quantity == amount - fee
 
+def test_importer_rereads_whole_handle_after_failed_load() -> None:
+    bad_row = ledger_row(ts=DEFAULT_TS, tx_type="deposit", asset="EUR", amount="10") | {"time": "2024-01-01"}
+    good_row = ledger_row(ts=DEFAULT_TS, tx_type="deposit", asset="EUR", amount="5")
+    importer = KrakenImporter(handle=csv_buffer([bad_row, good_row]))
 
-def test_withdrawal_fiat_becomes_withdrawal_event(tmp_path: Path) -> None:
-    amount = Decimal("-250.0000")
-    fee = Decimal("0.1000")
-    file = tmp_path / "fiat_withdrawal.csv"
-    write_csv(
-        file,
-        [
-            ledger_row(
-                ts=DEFAULT_TS,
-                tx_type="withdrawal",
-                asset="EUR",
-                amount=str(amount),
-                fee=str(fee),
-            )
-        ],
-    )
+    for _ in range(2):
+        with pytest.raises(ValueError, match="YYYY-MM-DD HH:MM:SS"):
+            importer.load_events()
 
-    importer = KrakenImporter(str(file))
-    events = importer.load_events()
 
-    assert len(events) == 1
-    event = events[0]
-    assert event.timestamp == DEFAULT_TS.replace(tzinfo=timezone.utc)
+@pytest.mark.parametrize("time", ["2024-01-01", "2024-01-01 12:00:00+02:00", "2024-01-01 12:00:00.5"])
+def test_ledger_entry_rejects_non_kraken_timestamps(time: str) -> None:
+    row = ledger_row(ts=DEFAULT_TS, tx_type="deposit", asset="EUR", amount="10") | {"time": time}
 
-    assert len(event.legs) == 1
-    leg = event.legs[0]
-    assert leg.asset_id == "EUR"
-    assert leg.quantity == amount - fee
+    with pytest.raises(ValueError, match="YYYY-MM-DD HH:MM:SS"):
+        KrakenLedgerEntry.model_validate(row)
 
 
-def test_withdrawal_fiat_without_fee(tmp_path: Path) -> None:
-    file = tmp_path / "fiat_withdrawal_no_fee.csv"
-    write_csv(
-        file,
-        [
-            ledger_row(
-                ts=DEFAULT_TS,
-                tx_type="withdrawal",
-                asset="EUR",
-                amount="-400.0000",
-            )
-        ],
+def test_importer_reads_ledger_csv_file(tmp_path: Path) -> None:
+    file = tmp_path / "ledger.csv"
+    file.write_text(
+        csv_buffer([ledger_row(ts=DEFAULT_TS, tx_type="deposit", asset="EUR", amount="10")]).read(), encoding="utf-8"
     )
 
-    importer = KrakenImporter(str(file))
-    event = importer.load_events()[0]
+    (event,) = KrakenImporter(str(file)).load_events()
 
-    assert len(event.legs) == 1
-    leg = event.legs[0]
-    assert leg.quantity == Decimal("-400.0000")
+    assert event.timestamp == DEFAULT_TS
 
 
-def test_withdrawal_crypto_becomes_transfer_event(tmp_path: Path) -> None:
-    file = tmp_path / "crypto_withdrawal.csv"
-    write_csv(
-        file,
-        [
+@pytest.mark.parametrize(
+    ("row", "asset_id", "quantity"),
+    [
+        pytest.param(
             ledger_row(
-                ts=DEFAULT_TS,
-                tx_type="withdrawal",
-                asset="ETH",
-                amount="-1.2500000000",
-            )
-        ],
-    )
-
-    importer = KrakenImporter(str(file))
-    events = importer.load_events()
-
-    assert len(events) == 1
-    event = events[0]
-    assert event.timestamp == DEFAULT_TS.replace(tzinfo=timezone.utc)
-
-    assert len(event.legs) == 1
-    leg = event.legs[0]
-    assert leg.asset_id == "ETH"
-    assert leg.quantity == Decimal("-1.25")
-
-
-def test_withdrawal_crypto_with_fee(tmp_path: Path) -> None:
-    amount = Decimal("-2.5000000000")
-    fee = Decimal("0.0500000000")
-    file = tmp_path / "crypto_withdrawal_with_fee.csv"
-    write_csv(
-        file,
-        [
+                ts=DEFAULT_TS, tx_type="deposit", asset="EUR", amount="100.5000", fee="0.2500", balance="100.5000"
+            ),
+            "EUR",
+            Decimal("100.25"),
+            id="deposit-fiat",
+        ),
+        pytest.param(
+            ledger_row(ts=DEFAULT_TS, tx_type="deposit", asset="EUR", amount="500.0000"),
+            "EUR",
+            Decimal("500"),
+            id="deposit-fiat-without-fee",
+        ),
+        pytest.param(
+            ledger_row(ts=DEFAULT_TS, tx_type="deposit", asset="ETH", amount="2.5000000000", balance="2.5000000000"),
+            "ETH",
+            Decimal("2.5"),
+            id="deposit-crypto",
+        ),
+        pytest.param(
+            ledger_row(ts=DEFAULT_TS, tx_type="deposit", asset="BTC", amount="0.25000000", fee="0.00500000"),
+            "BTC",
+            Decimal("0.245"),
+            id="deposit-crypto-with-fee",
+        ),
+        pytest.param(
+            ledger_row(ts=DEFAULT_TS, tx_type="withdrawal", asset="EUR", amount="-250.0000", fee="0.1000"),
+            "EUR",
+            Decimal("-250.1"),
+            id="withdrawal-fiat",
+        ),
+        pytest.param(
+            ledger_row(ts=DEFAULT_TS, tx_type="withdrawal", asset="EUR", amount="-400.0000"),
+            "EUR",
+            Decimal("-400"),
+            id="withdrawal-fiat-without-fee",
+        ),
+        pytest.param(
+            ledger_row(ts=DEFAULT_TS, tx_type="withdrawal", asset="ETH", amount="-1.2500000000"),
+            "ETH",
+            Decimal("-1.25"),
+            id="withdrawal-crypto",
+        ),
+        pytest.param(
+            ledger_row(ts=DEFAULT_TS, tx_type="withdrawal", asset="BTC", amount="-2.5000000000", fee="0.0500000000"),
+            "BTC",
+            Decimal("-2.55"),
+            id="withdrawal-crypto-with-fee",
+        ),
+        pytest.param(
+            ledger_row(ts=DEFAULT_TS, tx_type="staking", asset="ETH", amount="0.0017569136", fee="0.0003513827"),
+            "ETH",
+            Decimal("0.0014055309"),
+            id="staking-reward-with-fee",
+        ),
+        pytest.param(
+            ledger_row(ts=DEFAULT_TS, tx_type="deposit", asset="DOT28.S", amount="10.0000"),
+            "DOT",
+            Decimal("10"),
+            id="asset-alias",
+        ),
+        pytest.param(
             ledger_row(
                 ts=DEFAULT_TS,
-                tx_type="withdrawal",
-                asset="BTC",
-                amount=str(amount),
-                fee=str(fee),
-            )
-        ],
-    )
-
-    importer = KrakenImporter(str(file))
-    event = importer.load_events()[0]
-
-    assert event.timestamp == DEFAULT_TS.replace(tzinfo=timezone.utc)
+                tx_type="earn",
+                subtype="reward",
+                asset="USDC",
+                amount="1.21127078",
+                wallet="earn / flexible",
+            ),
+            "USDC",
+            Decimal("1.21127078"),
+            id="earn-reward",
+        ),
+        pytest.param(
+            ledger_row(ts=DEFAULT_TS, tx_type="transfer", subtype="spotfromfutures", asset="STRK", amount="125.80924"),
+            "STRK",
+            Decimal("125.80924"),
+            id="spot-from-futures",
+        ),
+    ],
+)
+def test_single_row_becomes_single_leg_event(
+    row: dict[str, str],
+    asset_id: str,
+    quantity: Decimal,
+) -> None:
+    (event,) = import_events([row])
 
-    assert len(event.legs) == 1
-    leg = event.legs[0]
-    assert leg.asset_id == "BTC"
-    assert leg.quantity == amount - fee
+    assert event.timestamp == DEFAULT_TS
+    (leg,) = event.legs
+    assert (leg.asset_id, leg.quantity) == (asset_id, quantity)
 
 
-def test_trade_event_with_fee(tmp_path: Path) -> None:
+def test_trade_event_with_fee() -> None:
     buy_amount = Decimal("1215.0000")
     buy_fee = Decimal("1.9440")
-    file = tmp_path / "trade.csv"
-    write_csv(
-        file,
+    events = import_events(
         [
             ledger_row(
                 txid="T1",
@@ -363,16 +298,10 @@ def test_trade_event_with_fee(tmp_path: Path) -> None:
         ],
     )
 
-    importer = KrakenImporter(str(file))
-    events = importer.load_events()
-
-    assert len(events) == 1
-    event = events[0]
-    assert event.timestamp == DEFAULT_TS.replace(tzinfo=timezone.utc)
+    (event,) = events
+    assert event.timestamp == DEFAULT_TS
 
-    assert len(event.legs) == 2
-    sell_leg = next(leg for leg in event.legs if leg.quantity < 0)
-    buy_leg = next(leg for leg in event.legs if leg.quantity > 0)
+    sell_leg, buy_leg = sorted(event.legs, key=attrgetter("quantity"))
 
     assert sell_leg.asset_id == "ETH"
     assert sell_leg.quantity == Decimal("-0.45")
@@ -380,12 +309,10 @@ def test_trade_event_with_fee(tmp_path: Path) -> None:
     assert buy_leg.quantity == buy_amount - buy_fee
 
 
-def test_spend_receive_trade(tmp_path: Path) -> None:
+def test_spend_receive_trade() -> None:
     amount_eur = Decimal("-172.2600")
     fee = Decimal("2.5900")
-    file = tmp_path / "spend_receive_trade.csv"
-    write_csv(
-        file,
+    event = import_events(
         [
             ledger_row(
                 txid="SR1",
@@ -405,105 +332,24 @@ def test_spend_receive_trade(tmp_path: Path) -> None:
                 amount="200.0000000000",
             ),
         ],
-    )
-
-    importer = KrakenImporter(str(file))
-    event = importer.load_events()[0]
-
-    assert event.timestamp == DEFAULT_TS.replace(tzinfo=timezone.utc)
-
-    sell_leg = next(leg for leg in event.legs if leg.asset_id == "EUR")
-    buy_leg = next(leg for leg in event.legs if leg.asset_id == "DAI")
-
-    assert sell_leg.quantity == amount_eur - fee
-    assert buy_leg.quantity == Decimal("200")
-
-
-def test_staking_reward_with_fee(tmp_path: Path) -> None:
-    amount = Decimal("0.0017569136")
-    fee = Decimal("0.0003513827")
-    file = tmp_path / "staking.csv"
-    write_csv(
-        file,
-        [
-            ledger_row(
-                ts=DEFAULT_TS,
-                tx_type="staking",
-                asset="ETH",
-                amount=str(amount),
-                fee=str(fee),
-            )
-        ],
-    )
-
-    importer = KrakenImporter(str(file))
-    events = importer.load_events()
-
-    assert len(events) == 1
-    event = events[0]
-    assert event.timestamp == DEFAULT_TS.replace(tzinfo=timezone.utc)
-
-    assert len(event.legs) == 1
-    reward_leg = event.legs[0]
-
-    assert reward_leg.asset_id == "ETH"
-    assert reward_leg.quantity == amount - fee
-
-
-def test_asset_aliases_are_applied(tmp_path: Path) -> None:
-    file = tmp_path / "alias.csv"
-    write_csv(
-        file,
-        [
-            ledger_row(
-                ts=DEFAULT_TS,
-                tx_type="deposit",
-                asset="DOT28.S",
-                amount="10.0000",
-            )
-        ],
-    )
-
-    importer = KrakenImporter(str(file))
-    event = importer.load_events()[0]
-
-    assert event.legs[0].asset_id == "DOT"
+    )[0]
 
+    assert event.timestamp == DEFAULT_TS
 
-def test_earn_reward_event(tmp_path: Path) -> None:
-    file = tmp_path / "earn_reward.csv"
-    write_csv(
-        file,
-        [
-            ledger_row(
-                ts=DEFAULT_TS,
-                tx_type="earn",
-                subtype="reward",
-                asset="USDC",
-                amount="1.21127078",
-                wallet="earn / flexible",
-            )
-        ],
-    )
-
-    importer = KrakenImporter(str(file))
-    event = importer.load_events()[0]
+    sell_leg, buy_leg = sorted(event.legs, key=attrgetter("quantity"))
 
-    assert event.legs[0].asset_id == "USDC"
-    assert event.legs[0].quantity == Decimal("1.21127078")
+    assert (sell_leg.asset_id, sell_leg.quantity) == ("EUR", amount_eur - fee)
+    assert (buy_leg.asset_id, buy_leg.quantity) == ("DAI", Decimal("200"))
 
 
-def test_explicit_refid_skip(tmp_path: Path) -> None:
-    ts1 = datetime(2024, 4, 17, 20, 36, 43)
-    ts2 = datetime(2024, 9, 10, 13, 48, 39)
-    file = tmp_path / "skip_refid.csv"
-    write_csv(
-        file,
+def test_explicit_refid_skip() -> None:
+    deallocated_at = DEFAULT_TS + timedelta(days=146)
+    events = import_events(
         [
             ledger_row(
                 txid="SK1",
                 refid="ELFI6E5-PNXZG-NSGNER",
-                ts=ts1,
+                ts=DEFAULT_TS,
                 tx_type="earn",
                 subtype="allocation",
                 asset="BTC",
@@ -512,7 +358,7 @@ def test_explicit_refid_skip(tmp_path: Path) -> None:
             ledger_row(
                 txid="SK2",
                 refid="ELFI6E5-PNXZG-NSGNER",
-                ts=ts1,
+                ts=DEFAULT_TS,
                 tx_type="earn",
                 subtype="allocation",
                 asset="BTC",
@@ -522,7 +368,7 @@ def test_explicit_refid_skip(tmp_path: Path) -> None:
             ledger_row(
                 txid="SK3",
                 refid="ELFI6E5-PNXZG-NSGNER",
-                ts=ts2,
+                ts=deallocated_at,
                 tx_type="earn",
                 subtype="deallocation",
                 asset="BTC",
@@ -532,7 +378,7 @@ def test_explicit_refid_skip(tmp_path: Path) -> None:
             ledger_row(
                 txid="SK4",
                 refid="ELFI6E5-PNXZG-NSGNER",
-                ts=ts2,
+                ts=deallocated_at,
                 tx_type="earn",
                 subtype="allocation",
                 asset="BTC",
@@ -542,62 +388,32 @@ def test_explicit_refid_skip(tmp_path: Path) -> None:
         ],
     )
 
-    importer = KrakenImporter(str(file))
-    events = importer.load_events()
-
     assert events == []
 
 
-def test_spot_from_futures_event(tmp_path: Path) -> None:
-    file = tmp_path / "spot_from_futures.csv"
-    write_csv(
-        file,
-        [
-            ledger_row(
-                ts=DEFAULT_TS,
-                tx_type="transfer",
-                subtype="spotfromfutures",
-                asset="STRK",
-                amount="125.80924",
-            )
-        ],
-    )
-
-    importer = KrakenImporter(str(file))
-    event = importer.load_events()[0]
-
-    assert event.timestamp == DEFAULT_TS.replace(tzinfo=timezone.utc)
-    assert len(event.legs) == 1
-    assert event.legs[0].asset_id == "STRK"
-    assert event.legs[0].quantity == Decimal("125.80924")
-
-
-def test_spot_from_futures_event_with_fee_raises(tmp_path: Path) -> None:
+def test_spot_from_futures_event_with_fee_raises() -> None:
     fee = Decimal("0.0025")
-    file = tmp_path / "spot_from_futures_with_fee.csv"
-    write_csv(
-        file,
-        [
-            ledger_row(
-                ts=DEFAULT_TS,
-                tx_type="transfer",
-                subtype="spotfromfutures",
-                asset="STRK",
-                amount="125.80924",
-                fee=str(fee),
-            )
-        ],
-    )
-
-    importer = KrakenImporter(str(file))
+    rows = [
+        ledger_row(
+            ts=DEFAULT_TS,
+            tx_type="transfer",
+            subtype="spotfromfutures",
+            asset="STRK",
+            amount="125.80924",
+            fee=str(fee),
+        )
+    ]
 
     with pytest.raises(ValueError):
-        importer.load_events()
+        import_events(rows)
+
+
+@pytest.fixture(scope="module")
+def preprocess_importer() -> KrakenImporter:
+    return KrakenImporter(entries=[])
 
 
-def test_preprocess_skips_spot_to_staking_pairs() -> None:
-    importer = KrakenImporter("/tmp/dummy.csv")
-    ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+def test_preprocess_skips_spot_to_staking_pairs(preprocess_importer: KrakenImporter) -> None:
     entries = [
         _preprocess_entry(
             refid="REF-A",
@@ -605,7 +421,7 @@ def test_preprocess_skips_spot_to_staking_pairs() -> None:
             subtype="spottostaking",
             asset="ETH",
             amount=Decimal("-4"),
-            timestamp=ts,
+            timestamp=PREPROCESS_TS,
         ),
         _preprocess_entry(
             refid="REF-B",
@@ -613,18 +429,16 @@ def test_preprocess_skips_spot_to_staking_pairs() -> None:
             subtype="stakingfromspot",
             asset="ETH2.S",
             amount=Decimal("4"),
-            timestamp=ts + timedelta(hours=4),
+            timestamp=PREPROCESS_TS + timedelta(hours=4),
         ),
     ]
 
-    filtered = importer._preprocess_entries(entries)
+    filtered = preprocess_importer._preprocess_entries(entries)
 
     assert filtered == []
 
 
-def test_preprocess_leaves_rows_outside_time_window() -> None:
-    importer = KrakenImporter("/tmp/dummy.csv")
-    ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+def test_preprocess_leaves_rows_outside_time_window(preprocess_importer: KrakenImporter) -> None:
     entries = [
         _preprocess_entry(
             refid="REF-C",
@@ -632,7 +446,7 @@ def test_preprocess_leaves_rows_outside_time_window() -> None:
             subtype="stakingtospot",
             asset="DOT.S",
             amount=Decimal("-100"),
-            timestamp=ts,
+            timestamp=PREPROCESS_TS,
         ),
         _preprocess_entry(
             refid="REF-D",
@@ -640,11 +454,11 @@ def test_preprocess_leaves_rows_outside_time_window() -> None:
             subtype="spotfromstaking",
             asset="DOT",
             amount=Decimal("100"),
-            timestamp=ts + timedelta(days=6),
+            timestamp=PREPROCESS_TS + timedelta(days=6),
         ),
     ]
 
-    filtered = importer._preprocess_entries(entries)
+    filtered = preprocess_importer._preprocess_entries(entries)
 
     assert len(filtered) == 2
     assert {entry.refid for entry in filtered} == {"REF-C", "REF-D"}
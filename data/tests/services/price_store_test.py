@@ -7,6 +7,8 @@ from domain.ledger import AssetId
 from domain.pricing import PriceRecord
 from tests.constants import BTC, ETH, EUR, USD
 
+TIMESTAMP = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
 
 def _price(base: AssetId, quote: AssetId, rate: str, timestamp: datetime, *, duration_minutes: int = 0) -> PriceRecord:
     valid_to = timestamp if duration_minutes == 0 else timestamp + timedelta(minutes=duration_minutes)
@@ -28,12 +30,11 @@ def _store(tmp_path: Path) -> PriceCacheRepository:
 
 def test_store_returns_snapshot_within_coverage_window(tmp_path: Path) -> None:
     store = _store(tmp_path)
-    valid_from = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
     base_id = BTC
     quote_id = EUR
     rate = "100.00"
 
-    store.write(_price(base_id, quote_id, rate, valid_from, duration_minutes=59))
+    store.write(_price(base_id, quote_id, rate, TIMESTAMP, duration_minutes=59))
 
     result = store.read(base_id, quote_id, datetime(2025, 1, 1, 12, 45, tzinfo=timezone.utc))
     assert result is not None
@@ -42,11 +43,10 @@ def test_store_returns_snapshot_within_coverage_window(tmp_path: Path) -> None:
 
 def test_store_returns_none_when_outside_coverage(tmp_path: Path) -> None:
     store = _store(tmp_path)
-    valid_from = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
     base_id = ETH
     quote_id = USD
     rate = "50.00"
-    price = _price(base_id, quote_id, rate, valid_from, duration_minutes=10)
+    price = _price(base_id, quote_id, rate, TIMESTAMP, duration_minutes=10)
     store.write(price)
 
     result = store.read(base_id, quote_id, datetime(2025, 1, 1, 12, 30, tzinfo=timezone.utc))
@@ -55,12 +55,11 @@ def test_store_returns_none_when_outside_coverage(tmp_path: Path) -> None:
 
 def test_store_prefers_higher_resolution_for_overlapping_windows(tmp_path: Path) -> None:
     store = _store(tmp_path)
-    ts = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
-    later_ts = ts.replace(second=30)
+    later_ts = TIMESTAMP.replace(second=30)
     base_id = BTC
     quote_id = USD
     later_rate = "101.00"
-    store.write(_price(base_id, quote_id, "100.00", ts, duration_minutes=60 * 12))
+    store.write(_price(base_id, quote_id, "100.00", TIMESTAMP, duration_minutes=60 * 12))
     store.write(_price(base_id, quote_id, later_rate, later_ts, duration_minutes=1))
 
     result = store.read(base_id, quote_id, later_ts)
@@ -70,7 +69,6 @@ def test_store_prefers_higher_resolution_for_overlapping_windows(tmp_path: Path)
 
 def test_store_records_negative_cache_rows(tmp_path: Path) -> None:
     store = _store(tmp_path)
-    valid_from = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
     base_id = BTC
     quote_id = EUR
 
@@ -80,27 +78,26 @@ def test_store_records_negative_cache_rows(tmp_path: Path) -> None:
             quote_id=quote_id,
             rate=None,
             source="test",
-            valid_from=valid_from,
-            valid_to=valid_from + timedelta(minutes=1),
-            fetched_at=valid_from,
+            valid_from=TIMESTAMP,
+            valid_to=TIMESTAMP + timedelta(minutes=1),
+            fetched_at=TIMESTAMP,
         )
     )
 
-    result = store.read(base_id, quote_id, valid_from)
+    result = store.read(base_id, quote_id, TIMESTAMP)
     assert result is not None
     assert result.rate is None
 
 
 def test_store_deduplicates_bucket_start(tmp_path: Path) -> None:
     store = _store(tmp_path)
-    timestamp = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
     base_id = ETH
     quote_id = EUR
     replacement_rate = "125.00"
 
-    store.write(_price(base_id, quote_id, "100.00", timestamp, duration_minutes=60))
-    store.write(_price(base_id, quote_id, replacement_rate, timestamp, duration_minutes=60))
+    store.write(_price(base_id, quote_id, "100.00", TIMESTAMP, duration_minutes=60))
+    store.write(_price(base_id, quote_id, replacement_rate, TIMESTAMP, duration_minutes=60))
 
-    result = store.read(base_id, quote_id, timestamp)
+    result = store.read(base_id, quote_id, TIMESTAMP)
     assert result is not None
     assert result.rate == Decimal(replacement_rate)